@@ -0,0 +1,131 @@
+"""Accuracy and performance harness for the conversion functions
+
+Samples points across all zones and latitude bands, including the special
+zones of Norway and Svalbard, and reports error percentiles in metres next
+to the throughput of ``from_latlon`` and ``to_latlon``:
+
+* forward: ``from_latlon`` against the reference implementation
+* inverse: ``to_latlon`` of reference UTM coordinates against the sampled
+  latitude/longitude
+* round trip: ``to_latlon(from_latlon(...))`` against the sampled points
+
+Run it with ``python -m test.harness --points 10000000``. Requires NumPy.
+"""
+import argparse
+import time
+
+import numpy as np
+
+import utm
+from utm.bulk import latlon_to_zone_numbers
+from test import reference
+
+PERCENTILES = [50, 90, 99, 99.9, 100]
+
+# Metres per degree of latitude, good enough to express small errors in metres
+METRES_PER_DEGREE = 111320
+
+
+def sample(count, seed=0):
+    """Returns random latitudes and longitudes within the UTM area
+
+    One fifth of the points is placed in the special zones of Norway and
+    Svalbard, the rest is spread uniformly over all zones and bands.
+    """
+    rng = np.random.default_rng(seed)
+    special = count // 10
+    regular = count - 2 * special
+    latitude = np.concatenate([rng.uniform(-80, 84, regular),
+                               rng.uniform(56, 64, special),
+                               rng.uniform(72, 84, special)])
+    longitude = np.concatenate([rng.uniform(-180, 180, regular),
+                                rng.uniform(0, 12, special),
+                                rng.uniform(0, 42, special)])
+    return latitude, longitude
+
+
+def _groups(zone_number, northern):
+    """Yields index arrays of the points in each zone and hemisphere"""
+    keys = zone_number * 2 + northern
+    order = np.argsort(keys, kind='stable')
+    bounds = np.flatnonzero(np.diff(keys[order])) + 1
+    for indices in np.split(order, bounds):
+        if len(indices):
+            yield indices, int(zone_number[indices[0]]), bool(northern[indices[0]])
+
+
+def _distance(lat1, lon1, lat2, lon2):
+    dlon = (lon2 - lon1 + 180) % 360 - 180
+    return METRES_PER_DEGREE * np.hypot(lat2 - lat1, dlon * np.cos(np.radians(lat1)))
+
+
+def run(count, seed=0):
+    """Runs the harness and returns a dictionary of results
+
+    Every entry of the result holds the error percentiles in metres, and the
+    ``from_latlon`` and ``to_latlon`` entries also hold the throughput in
+    points per second.
+    """
+    latitude, longitude = sample(count, seed)
+    zone_number = latlon_to_zone_numbers(latitude, longitude)
+    northern = latitude >= 0
+    groups = list(_groups(zone_number, northern))
+
+    ref_easting, ref_northing = reference.from_latlon(latitude, longitude, zone_number, northern)
+
+    easting = np.empty(count)
+    northing = np.empty(count)
+    start = time.perf_counter()
+    for indices, zone, hemisphere in groups:
+        easting[indices], northing[indices], _, _ = utm.from_latlon(
+            latitude[indices], longitude[indices], force_zone_number=zone, force_northern=hemisphere)
+    forward_seconds = time.perf_counter() - start
+
+    inv_latitude = np.empty(count)
+    inv_longitude = np.empty(count)
+    start = time.perf_counter()
+    for indices, zone, hemisphere in groups:
+        inv_latitude[indices], inv_longitude[indices] = utm.to_latlon(
+            ref_easting[indices], ref_northing[indices], zone, northern=hemisphere, strict=False)
+    inverse_seconds = time.perf_counter() - start
+
+    trip_latitude = np.empty(count)
+    trip_longitude = np.empty(count)
+    for indices, zone, hemisphere in groups:
+        trip_latitude[indices], trip_longitude[indices] = utm.to_latlon(
+            easting[indices], northing[indices], zone, northern=hemisphere, strict=False)
+
+    def percentiles(errors):
+        return dict(zip(PERCENTILES, np.percentile(errors, PERCENTILES)))
+
+    return {
+        'from_latlon': dict(percentiles(np.hypot(easting - ref_easting, northing - ref_northing)),
+                            points_per_second=count / forward_seconds),
+        'to_latlon': dict(percentiles(_distance(latitude, longitude, inv_latitude, inv_longitude)),
+                          points_per_second=count / inverse_seconds),
+        'round_trip': percentiles(_distance(latitude, longitude, trip_latitude, trip_longitude)),
+    }
+
+
+def report(results):
+    header = '%-12s' % '' + ''.join('%12s' % ('p%g [m]' % p) for p in PERCENTILES) + '%14s' % 'points/s'
+    lines = [header]
+    for name, values in results.items():
+        line = '%-12s' % name + ''.join('%12.3g' % values[p] for p in PERCENTILES)
+        if 'points_per_second' in values:
+            line += '%14.0f' % values['points_per_second']
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Accuracy and performance harness for utm')
+    parser.add_argument('--points', type=int, default=1000000, help='Number of sampled points')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the random number generator')
+    args = parser.parse_args()
+
+    print(report(run(args.points, args.seed)))
+
+
+if __name__ == '__main__':
+    main()
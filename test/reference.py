@@ -0,0 +1,92 @@
+"""High-precision reference implementation of the UTM projection
+
+This uses the Krüger series to sixth order in the third flattening, as given
+by C. F. F. Karney, "Transverse Mercator with an accuracy of a few
+nanometers", J. Geodesy 85(8), 475-485 (2011). Within the UTM zones the
+truncation error is below 5 nm, so it can be used to measure the error of
+the faster series in ``utm.conversion``. Requires NumPy.
+"""
+import numpy as np
+
+A = 6378137
+F = 1 / 298.257223563
+K0 = 0.9996
+
+N = F / (2 - F)
+E2 = F * (2 - F)
+E = np.sqrt(E2)
+
+RECTIFYING_RADIUS = A / (1 + N) * (1 + N**2 / 4 + N**4 / 64 + N**6 / 256)
+
+ALPHA = [
+    N / 2 - 2 * N**2 / 3 + 5 * N**3 / 16 + 41 * N**4 / 180 - 127 * N**5 / 288 + 7891 * N**6 / 37800,
+    13 * N**2 / 48 - 3 * N**3 / 5 + 557 * N**4 / 1440 + 281 * N**5 / 630 - 1983433 * N**6 / 1935360,
+    61 * N**3 / 240 - 103 * N**4 / 140 + 15061 * N**5 / 26880 + 167603 * N**6 / 181440,
+    49561 * N**4 / 161280 - 179 * N**5 / 168 + 6601661 * N**6 / 7257600,
+    34729 * N**5 / 80640 - 3418889 * N**6 / 1995840,
+    212378941 * N**6 / 319334400,
+]
+
+BETA = [
+    N / 2 - 2 * N**2 / 3 + 37 * N**3 / 96 - N**4 / 360 - 81 * N**5 / 512 + 96199 * N**6 / 604800,
+    N**2 / 48 + N**3 / 15 - 437 * N**4 / 1440 + 46 * N**5 / 105 - 1118711 * N**6 / 3870720,
+    17 * N**3 / 480 - 37 * N**4 / 840 - 209 * N**5 / 4480 + 5569 * N**6 / 90720,
+    4397 * N**4 / 161280 - 11 * N**5 / 504 - 830251 * N**6 / 7257600,
+    4583 * N**5 / 161280 - 108847 * N**6 / 3991680,
+    20648693 * N**6 / 638668800,
+]
+
+
+def central_longitude(zone_number):
+    return (np.asarray(zone_number) - 1) * 6 - 180 + 3
+
+
+def _conformal_tan(tau):
+    sigma = np.sinh(E * np.arctanh(E * tau / np.hypot(1, tau)))
+    return tau * np.hypot(1, sigma) - sigma * np.hypot(1, tau)
+
+
+def from_latlon(latitude, longitude, zone_number, northern):
+    """Projects latitude/longitude into the given zones, returns easting and northing"""
+    lat = np.radians(latitude)
+    lon = np.radians(np.asarray(longitude) - central_longitude(zone_number))
+    lon = (lon + np.pi) % (2 * np.pi) - np.pi
+
+    tau_p = _conformal_tan(np.tan(lat))
+    xi_p = np.arctan2(tau_p, np.cos(lon))
+    eta_p = np.arcsinh(np.sin(lon) / np.hypot(tau_p, np.cos(lon)))
+
+    xi = xi_p.copy()
+    eta = eta_p.copy()
+    for j, alpha in enumerate(ALPHA, 1):
+        xi += alpha * np.sin(2 * j * xi_p) * np.cosh(2 * j * eta_p)
+        eta += alpha * np.cos(2 * j * xi_p) * np.sinh(2 * j * eta_p)
+
+    easting = K0 * RECTIFYING_RADIUS * eta + 500000
+    northing = K0 * RECTIFYING_RADIUS * xi
+    return easting, np.where(northern, northing, northing + 10000000)
+
+
+def to_latlon(easting, northing, zone_number, northern):
+    """Inverse of ``from_latlon``, returns latitude and longitude in degrees"""
+    xi = np.where(northern, northing, np.asarray(northing) - 10000000) / (K0 * RECTIFYING_RADIUS)
+    eta = (np.asarray(easting) - 500000) / (K0 * RECTIFYING_RADIUS)
+
+    xi_p = xi.copy()
+    eta_p = eta.copy()
+    for j, beta in enumerate(BETA, 1):
+        xi_p -= beta * np.sin(2 * j * xi) * np.cosh(2 * j * eta)
+        eta_p -= beta * np.cos(2 * j * xi) * np.sinh(2 * j * eta)
+
+    tau_p = np.sin(xi_p) / np.hypot(np.sinh(eta_p), np.cos(xi_p))
+    lon = np.arctan2(np.sinh(eta_p), np.cos(xi_p))
+
+    # Newton's method for the geographic from the conformal latitude
+    tau = tau_p.copy()
+    for _ in range(5):
+        tau_i = _conformal_tan(tau)
+        tau += ((tau_p - tau_i) / np.hypot(1, tau_i) *
+                (1 + (1 - E2) * tau**2) / ((1 - E2) * np.hypot(1, tau)))
+
+    longitude = np.degrees(lon) + central_longitude(zone_number)
+    return np.degrees(np.arctan(tau)), (longitude + 180) % 360 - 180
@@ -0,0 +1,60 @@
+import pytest
+
+pytest.importorskip("numpy")
+harness = pytest.importorskip("test.harness")
+reference = pytest.importorskip("test.reference")
+
+import numpy as np
+
+from utm.bulk import latlon_to_zone_numbers
+
+# Maximum errors in metres that the conversion functions are allowed to have
+# against the reference implementation. Faster kernels must stay below these.
+THRESHOLDS = {
+    'from_latlon': {99: 0.001, 100: 0.002},
+    'to_latlon': {99: 0.025, 100: 0.06},
+    'round_trip': {99: 0.025, 100: 0.06},
+}
+
+
+@pytest.fixture(scope="module")
+def results():
+    return harness.run(200000)
+
+
+@pytest.mark.parametrize("name", sorted(THRESHOLDS))
+def test_accuracy(results, name):
+    for percentile, threshold in THRESHOLDS[name].items():
+        assert results[name][percentile] < threshold, (name, percentile)
+
+
+def test_report(results):
+    lines = harness.report(results).splitlines()
+    assert len(lines) == 4
+    assert 'points/s' in lines[0]
+
+
+def test_sample_covers_special_zones():
+    latitude, longitude = harness.sample(10000)
+    zones = set(latlon_to_zone_numbers(latitude, longitude))
+    assert zones == set(range(1, 61))
+    assert latitude.min() >= -80 and latitude.max() <= 84
+
+
+def test_reference_round_trip():
+    latitude, longitude = harness.sample(10000)
+    zone_number = latlon_to_zone_numbers(latitude, longitude)
+    northern = latitude >= 0
+    easting, northing = reference.from_latlon(latitude, longitude, zone_number, northern)
+    result = reference.to_latlon(easting, northing, zone_number, northern)
+    assert np.max(harness._distance(latitude, longitude, *result)) < 1e-6
+
+
+@pytest.mark.parametrize("latlon, utm, utm_kw", [
+    ((50.77535, 6.08389), (294409, 5628898, 32, "U"), {"northern": True}),
+    ((-41.28646, 174.77624), (313784, 5427057, 60, "G"), {"northern": False}),
+])
+def test_reference_known_values(latlon, utm, utm_kw):
+    easting, northing = reference.from_latlon(*latlon, utm[2], **utm_kw)
+    assert easting == pytest.approx(utm[0], abs=1)
+    assert northing == pytest.approx(utm[1], abs=1)
@@ -0,0 +1,173 @@
+import subprocess
+import sys
+
+import utm as UTM
+
+import pytest
+
+np = pytest.importorskip("numpy")
+bulk = pytest.importorskip("utm.bulk")
+batch = pytest.importorskip("utm.batch")
+
+rng = np.random.default_rng(42)
+points = np.column_stack([rng.uniform(-80, 84, 1000), rng.uniform(-180, 180, 1000)])
+
+
+def write_csv(path, lines):
+    with open(path, 'w') as f:
+        f.write(''.join(line + '\n' for line in lines))
+
+
+def test_shard_ranges_csv(tmp_path):
+    path = tmp_path / "points.csv"
+    write_csv(path, ['%r,%r' % tuple(point) for point in points.tolist()])
+    data = path.read_bytes()
+
+    ranges = batch.shard_ranges(str(path), 7)
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert data[start - 1:start] == b'\n'
+
+
+def test_shard_ranges_more_shards_than_lines(tmp_path):
+    path = tmp_path / "points.csv"
+    write_csv(path, ['1,2', '3,4'])
+    ranges = batch.shard_ranges(str(path), 10)
+    assert ranges == [(0, 4), (4, 8)]
+
+
+def test_shard_ranges_binary(tmp_path):
+    np.save(tmp_path / "points.npy", points)
+    ranges = batch.shard_ranges(str(tmp_path / "points.npy"), 3, fields=2)
+    assert ranges == [(0, 333), (333, 666), (666, 1000)]
+
+
+def test_read_lines_small_blocks(tmp_path, monkeypatch):
+    monkeypatch.setattr(batch, 'BLOCK_SIZE', 5)
+    path = tmp_path / "points.csv"
+    write_csv(path, ['1.5,2', '', '3,4.25', '50,6'])
+    lines = [line for block in batch._read_lines(str(path), 0, path.stat().st_size) for line in block]
+    assert lines == ['1.5,2', '3,4.25', '50,6']
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_convert_csv(tmp_path, jobs):
+    source = tmp_path / "points.csv"
+    write_csv(source, ['%r,%r' % tuple(point) for point in points.tolist()])
+
+    count, paths = batch.convert_file_parallel(str(source), str(tmp_path / "utm.csv"), 'latlon', jobs=jobs)
+    assert count == len(points)
+    assert paths == [str(tmp_path / "utm.csv")]
+
+    lines = (tmp_path / "utm.csv").read_text().splitlines()
+    assert len(lines) == len(points)
+    for line, (lat, lon) in zip(lines, points):
+        easting, northing, zone_number, zone_letter = line.split(',')
+        expected = UTM.from_latlon(lat, lon)
+        assert float(easting) == pytest.approx(expected[0])
+        assert float(northing) == pytest.approx(expected[1])
+        assert (int(zone_number), zone_letter) == expected[2:]
+
+    count, _ = batch.convert_file_parallel(str(tmp_path / "utm.csv"), str(tmp_path / "back.csv"), 'utm', jobs=jobs)
+    assert count == len(points)
+    result = np.loadtxt(tmp_path / "back.csv", delimiter=',')
+    assert np.allclose(result[:, 0], points[:, 0])
+
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_convert_csv_malformed_line(tmp_path, jobs):
+    source = tmp_path / "points.csv"
+    lines = ['%r,%r' % tuple(point) for point in points.tolist()]
+    lines[500] = 'not,a number'
+    write_csv(source, lines)
+
+    with pytest.raises(ValueError):
+        batch.convert_file_parallel(str(source), str(tmp_path / "utm.csv"), 'latlon', jobs=jobs)
+    # No output and no leftover files of the shards
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['points.csv']
+
+
+@pytest.mark.parametrize("suffix", [".npy", ".csv"])
+def test_convert_keeps_existing_part_files(tmp_path, suffix):
+    source = tmp_path / ("points" + suffix)
+    if suffix == ".csv":
+        write_csv(source, ['%r,%r' % tuple(point) for point in points.tolist()])
+    else:
+        np.save(source, points)
+    target = str(tmp_path / ("utm" + suffix))
+
+    # Output files of an earlier run with split output
+    _, parts = batch.convert_file_parallel(str(source), target, 'latlon', jobs=2, split_output=True)
+    contents = [open(path, 'rb').read() for path in parts]
+
+    batch.convert_file_parallel(str(source), target, 'latlon', jobs=2)
+    assert [open(path, 'rb').read() for path in parts] == contents
+
+    if suffix == ".csv":
+        write_csv(source, ['not,a number'])
+        with pytest.raises(ValueError):
+            batch.convert_file_parallel(str(source), target, 'latlon', jobs=2)
+        assert [open(path, 'rb').read() for path in parts] == contents
+
+
+@pytest.mark.parametrize("zone_letter", ['Z', 'I', 'A'])
+def test_convert_csv_invalid_zone_letter(tmp_path, zone_letter):
+    source = tmp_path / "utm.csv"
+    write_csv(source, ['500000,5000000,32,U', '500000,5000000,32,' + zone_letter])
+    with pytest.raises(UTM.OutOfRangeError):
+        batch.convert_file_parallel(str(source), str(tmp_path / "points.csv"), 'utm', jobs=1)
+
+def test_convert_csv_split_output(tmp_path):
+    source = tmp_path / "points.csv"
+    write_csv(source, ['%r,%r' % tuple(point) for point in points.tolist()])
+
+    progress = []
+    count, paths = batch.convert_file_parallel(str(source), str(tmp_path / "utm.csv"), 'latlon', jobs=2,
+                                               split_output=True, progress=lambda *args: progress.append(args))
+    assert count == len(points)
+    assert len(paths) == 2 * batch.SHARDS_PER_JOB
+    assert paths[0] == str(tmp_path / "utm.0000.csv")
+    assert sum(len(open(path).read().splitlines()) for path in paths) == len(points)
+    assert len(progress) == len(paths)
+    assert progress[-1][0] == len(points)
+
+
+@pytest.mark.parametrize("split_output", [False, True])
+@pytest.mark.parametrize("suffix", [".npy", ".bin"])
+def test_convert_binary(tmp_path, suffix, split_output):
+    source = tmp_path / ("points" + suffix)
+    if suffix == ".npy":
+        np.save(source, points)
+    else:
+        points.tofile(source)
+
+    target = str(tmp_path / ("utm" + suffix))
+    count, paths = batch.convert_file_parallel(str(source), target, 'latlon', jobs=2, split_output=split_output)
+    assert count == len(points)
+    result = np.concatenate([bulk.open_records(path, 4) for path in paths])
+    assert np.allclose(result, bulk.from_latlon_records(points))
+
+
+def test_parallel_instrumentation(tmp_path):
+    np.save(tmp_path / "points.npy", points)
+    UTM.conversion.reset_stats()
+    UTM.conversion.enable_instrumentation()
+    try:
+        batch.convert_file_parallel(str(tmp_path / "points.npy"), str(tmp_path / "utm.npy"), 'latlon', jobs=2)
+        stats = UTM.conversion.get_stats()
+    finally:
+        UTM.conversion.disable_instrumentation()
+        UTM.conversion.reset_stats()
+    assert stats['from_latlon']['parallel']['points'] == len(points)
+
+
+def test_cli_jobs(tmp_path):
+    write_csv(tmp_path / "points.csv", ['%r,%r' % tuple(point) for point in points[:10].tolist()])
+    output = subprocess.run([sys.executable, "-m", "utm.cli", "file", "latlon", "--jobs", "2",
+                             str(tmp_path / "points.csv"), str(tmp_path / "utm.csv")],
+                            check=True, capture_output=True, text=True)
+    assert "10 points converted" in output.stderr
+    assert len((tmp_path / "utm.csv").read_text().splitlines()) == 10
@@ -0,0 +1,100 @@
+import subprocess
+import sys
+
+import utm as UTM
+
+import pytest
+
+np = pytest.importorskip("numpy")
+bulk = pytest.importorskip("utm.bulk")
+
+points = np.array([
+    [50.77535, 6.08389],
+    [40.71435, -74.00597],
+    [-41.28646, 174.77624],
+    [60.38952, 5.320675],
+    [79.45574, 18.76338],
+    [0, 180],
+    [-0.1, 0],
+])
+
+
+def test_latlon_to_zone_numbers():
+    expected = [UTM.latlon_to_zone_number(lat, lon) for lat, lon in points]
+    assert list(bulk.latlon_to_zone_numbers(points[:, 0], points[:, 1])) == expected
+
+
+def test_records_match_scalar_conversion():
+    records = bulk.from_latlon_records(points)
+    for (lat, lon), (easting, northing, zone_number, northern) in zip(points, records):
+        expected = UTM.from_latlon(lat, lon)
+        assert easting == pytest.approx(expected[0])
+        assert northing == pytest.approx(expected[1])
+        assert zone_number == expected[2]
+        assert bool(northern) == (expected[3] >= 'N')
+
+    result = bulk.to_latlon_records(records)
+    assert np.allclose(result[:, 0], points[:, 0])
+    assert np.allclose(np.cos(np.radians(result[:, 1] - points[:, 1])), 1)
+
+
+def test_records_out_of_range():
+    with pytest.raises(UTM.OutOfRangeError):
+        bulk.from_latlon_records(np.array([[85.0, 0.0]]))
+    with pytest.raises(UTM.OutOfRangeError):
+        bulk.to_latlon_records(np.array([[50000.0, 0.0, 31.0, 1.0]]))
+    with pytest.raises(UTM.OutOfRangeError):
+        bulk.to_latlon_records(np.array([[500000.0, 0.0, 61.0, 1.0]]))
+    with pytest.raises(UTM.OutOfRangeError):
+        bulk.to_latlon_records(np.array([[500000.0, 0.0, 31.0, 1.0], [500000.0, 0.0, 32.5, 1.0]]))
+
+
+@pytest.mark.parametrize("suffix, format", [(".npy", None), (".bin", None), (".dat", "raw")])
+def test_convert_file(tmp_path, suffix, format):
+    source = tmp_path / ("latlon" + suffix)
+    target = tmp_path / ("utm" + suffix)
+    back = tmp_path / ("back" + suffix)
+    if suffix == ".npy":
+        np.save(source, points)
+    else:
+        points.astype('<f8').tofile(source)
+
+    assert bulk.convert_file(str(source), str(target), 'latlon', format, chunk_size=3) == len(points)
+    records = bulk.open_records(str(target), 4, format)
+    assert np.allclose(records, bulk.from_latlon_records(points))
+
+    assert bulk.convert_file(str(target), str(back), 'utm', format, chunk_size=3) == len(points)
+    assert np.allclose(bulk.open_records(str(back), 2, format), bulk.to_latlon_records(records))
+
+
+def test_convert_file_mixed_formats(tmp_path):
+    np.save(tmp_path / "latlon.npy", points)
+    bulk.convert_file(str(tmp_path / "latlon.npy"), str(tmp_path / "utm.bin"), 'latlon')
+    records = np.fromfile(tmp_path / "utm.bin", dtype='<f8').reshape(-1, 4)
+    assert np.allclose(records, bulk.from_latlon_records(points))
+
+
+def test_convert_empty_file(tmp_path):
+    (tmp_path / "latlon.bin").write_bytes(b"")
+    assert bulk.convert_file(str(tmp_path / "latlon.bin"), str(tmp_path / "utm.bin"), 'latlon') == 0
+    assert (tmp_path / "utm.bin").read_bytes() == b""
+
+
+def test_invalid_files(tmp_path):
+    (tmp_path / "latlon.bin").write_bytes(b"\0" * 24)
+    with pytest.raises(ValueError):
+        bulk.convert_file(str(tmp_path / "latlon.bin"), str(tmp_path / "utm.bin"), 'latlon')
+
+    np.save(tmp_path / "latlon.npy", points[:, :1])
+    with pytest.raises(ValueError):
+        bulk.convert_file(str(tmp_path / "latlon.npy"), str(tmp_path / "utm.npy"), 'latlon')
+
+    with pytest.raises(ValueError):
+        bulk.convert_file(str(tmp_path / "latlon.npy"), str(tmp_path / "utm.npy"), 'wgs84')
+
+
+def test_cli(tmp_path):
+    np.save(tmp_path / "latlon.npy", points)
+    subprocess.check_call([sys.executable, "-m", "utm.cli", "file", "latlon",
+                           str(tmp_path / "latlon.npy"), str(tmp_path / "utm.npy")])
+    assert np.allclose(np.load(tmp_path / "utm.npy"), bulk.from_latlon_records(points))
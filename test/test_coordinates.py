@@ -0,0 +1,104 @@
+import utm as UTM
+
+import pytest
+
+try:
+    import numpy as np
+
+    use_numpy = True
+except ImportError:
+    use_numpy = False
+
+
+def test_utm_coord_is_tuple():
+    coord = UTM.UTMCoord(*UTM.from_latlon(51.2, 7.5))
+    assert coord == UTM.from_latlon(51.2, 7.5)
+    easting, northing, zone_number, zone_letter = coord
+    assert (zone_number, zone_letter) == (32, 'U')
+    assert coord.easting == easting
+
+
+def test_coord_round_trip():
+    latlon = UTM.LatLon(51.2, 7.5)
+    coord = latlon.to_utm()
+    assert isinstance(coord, UTM.UTMCoord)
+    result = coord.to_latlon()
+    assert isinstance(result, UTM.LatLon)
+    assert result.latitude == pytest.approx(51.2)
+    assert result.longitude == pytest.approx(7.5)
+
+
+def test_coord_has_no_dict():
+    with pytest.raises(AttributeError):
+        UTM.UTMCoord(1, 2, 3, 'U').__dict__
+    with pytest.raises(AttributeError):
+        UTM.UTMArray([], [], 32, 'U').foo = 1
+
+
+def test_array_round_trip():
+    latlons = UTM.LatLonArray([51.2, 49.0, 50.0], [7.5, 8.4, 9.0])
+    utms = latlons.to_utm()
+    assert len(utms) == 3
+    assert (utms.zone_number, utms.zone_letter, utms.northern) == (32, 'U', True)
+    assert tuple(utms[0])[:2] == pytest.approx(UTM.from_latlon(51.2, 7.5)[:2])
+
+    result = utms.to_latlon()
+    assert list(result.latitude) == pytest.approx([51.2, 49.0, 50.0])
+    assert list(result.longitude) == pytest.approx([7.5, 8.4, 9.0])
+    assert result[1].latitude == pytest.approx(49.0)
+    assert [p.longitude for p in result] == pytest.approx([7.5, 8.4, 9.0])
+
+
+def test_array_force_northern():
+    utms = UTM.LatLonArray([-0.1, 0.1], [0, 0]).to_utm(force_northern=False)
+    assert utms.zone_letter is None
+    assert utms.northern is False
+    result = utms.to_latlon(strict=False)
+    assert list(result.latitude) == pytest.approx([-0.1, 0.1])
+
+
+def test_array_mixed_signs():
+    with pytest.raises(ValueError, match="latitudes must all have the same sign"):
+        UTM.LatLonArray([-0.1, 0.1], [0, 0]).to_utm()
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({}, "either zone_letter or northern needs to be set"),
+        ({"zone_letter": "U", "northern": True}, "set either zone_letter or northern, but not both"),
+    ],
+)
+def test_utm_array_zone_args(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        UTM.UTMArray([1], [2], 32, **kwargs)
+
+
+def test_utm_array_invalid_zone():
+    with pytest.raises(UTM.OutOfRangeError):
+        UTM.UTMArray([1], [2], 61, 'U')
+
+
+def test_array_length_mismatch():
+    with pytest.raises(ValueError):
+        UTM.LatLonArray([1, 2], [3])
+
+
+@pytest.mark.skipif(not use_numpy, reason="numpy not installed")
+def test_array_numpy_backed():
+    latlons = UTM.LatLonArray(np.array([51.2, 49.0]), np.array([7.5, 8.4]))
+    utms = latlons.to_utm()
+    assert isinstance(utms.easting, np.ndarray)
+    expected = UTM.from_latlon(np.array([51.2, 49.0]), np.array([7.5, 8.4]))
+    assert np.allclose(utms.easting, expected[0])
+    assert np.allclose(utms.northing, expected[1])
+
+
+def test_utm_array_reproject():
+    utms = UTM.LatLonArray([50.7, 50.8], [5.5, 6.0]).to_utm(force_zone_number=32)
+    result = utms.reproject(31)
+    expected = utms.to_latlon().to_utm(force_zone_number=31)
+    assert result.zone_number == 31
+    assert result.zone_letter == 'U'
+    assert list(result.easting) == pytest.approx(list(expected.easting), abs=1e-6)
+    assert list(result.northing) == pytest.approx(list(expected.northing), abs=1e-6)
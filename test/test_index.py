@@ -0,0 +1,207 @@
+import utm as UTM
+from utm.index import GridIndex
+from utm.track import TrackConverter
+
+import pytest
+
+try:
+    import numpy as np
+
+    use_numpy = True
+except ImportError:
+    use_numpy = False
+
+
+def test_insert_remove():
+    index = GridIndex(cell_size=100)
+    index.insert('a', 500000, 5000000, 32, 'U')
+    index.insert('b', 500050, 5000000, 32, 'U')
+    assert len(index) == 2
+    assert 'a' in index
+
+    index.remove('a')
+    assert 'a' not in index
+    assert len(index) == 1
+    with pytest.raises(KeyError):
+        index.remove('a')
+
+    # Inserting an existing key moves the point
+    index.insert('b', 600000, 5000000, 32, 'U')
+    assert len(index) == 1
+    assert index.query_radius(1000, 500000, 5000000, 32, 'U') == []
+
+
+def test_insert_invalid_zone():
+    with pytest.raises(ValueError):
+        GridIndex().insert('a', 500000, 5000000, 32)
+    with pytest.raises(UTM.OutOfRangeError):
+        GridIndex().insert('a', 500000, 5000000, 61, 'U')
+
+
+def test_query_radius():
+    index = GridIndex(cell_size=100)
+    for i in range(10):
+        index.insert(i, 500000 + i * 30, 5000000, 32, 'U')
+
+    result = index.query_radius(50, 500100, 5000000, 32, 'U')
+    assert [key for key, _ in result] == [3, 4, 2, 5]
+    assert [distance for _, distance in result] == pytest.approx([10, 20, 40, 50])
+
+
+def test_query_radius_large():
+    # More cells in the query rectangle than occupied cells
+    index = GridIndex(cell_size=1)
+    index.insert('a', 500000, 5000000, 32, 'U')
+    index.insert('b', 510000, 5000000, 32, 'U')
+    assert [key for key, _ in index.query_radius(20000, 500000, 5000000, 32, 'U')] == ['a', 'b']
+    with pytest.raises(ValueError):
+        index.query_radius(2000000, 500000, 5000000, 32, 'U')
+
+
+def test_query_across_equator():
+    index = GridIndex()
+    index.insert('north', *UTM.from_latlon(0.001, 3))
+    index.insert('south', *UTM.from_latlon(-0.001, 3))
+
+    result = index.query_radius(500, *UTM.from_latlon(0.0005, 3)[:3], northern=True)
+    assert [key for key, _ in result] == ['north', 'south']
+    assert [distance for _, distance in result] == pytest.approx([55.3, 165.8], abs=0.5)
+
+
+@pytest.mark.parametrize("lon", [6.0, 180.0])
+def test_query_across_zones(lon):
+    # Points west and east of a zone border, stored in their own zones
+    index = GridIndex()
+    west = UTM.from_latlon(50, lon - 0.001)
+    east = UTM.from_latlon(50, lon + 0.001 - (360 if lon == 180 else 0))
+    assert west[2] != east[2]
+    index.insert('west', *west)
+    index.insert('east', *east)
+
+    result = index.query_radius(200, *west)
+    assert [key for key, _ in result] == ['west', 'east']
+    assert result[1][1] == pytest.approx(143.3, abs=0.5)
+
+    result = index.query_radius(200, *east)
+    assert [key for key, _ in result] == ['east', 'west']
+    assert result[1][1] == pytest.approx(143.3, abs=0.5)
+
+
+def test_nearest():
+    index = GridIndex(cell_size=10)
+    for i in range(100):
+        index.insert(i, 500000 + i * 100, 5000000, 32, 'U')
+
+    result = index.nearest(3, 503020, 5000000, 32, 'U')
+    assert [key for key, _ in result] == [30, 31, 29]
+    assert [distance for _, distance in result] == pytest.approx([20, 80, 120])
+
+    assert len(index.nearest(1000, 500000, 5000000, 32, 'U')) == 100
+    assert GridIndex().nearest(3, 500000, 5000000, 32, 'U') == []
+
+
+@pytest.mark.skipif(not use_numpy, reason="numpy not installed")
+def test_extend_from_batch():
+    lats = np.array([50.0, 50.001, 50.002])
+    lons = np.array([7.0, 7.0, 7.0])
+    index = GridIndex()
+    index.extend(*UTM.from_latlon(lats, lons))
+    assert len(index) == 3
+
+    result = index.nearest(2, *UTM.from_latlon(50.0021, 7.0))
+    assert [key for key, _ in result] == [2, 1]
+
+
+@pytest.mark.skipif(not use_numpy, reason="numpy not installed")
+def test_extend_from_track():
+    lats = np.array([50.0, 50.0, 50.0])
+    lons = np.array([5.999, 6.0, 6.001])
+    index = GridIndex()
+    index.extend(*TrackConverter().extend(lats, lons))
+    assert len(index) == 3
+
+    result = index.query_radius(100, *UTM.from_latlon(50.0, 6.0))
+    assert result[0][0] == 1
+    assert sorted(key for key, _ in result) == [0, 1, 2]
+
+
+def test_extend_per_point_letters():
+    index = GridIndex()
+    index.extend([500000, 500000], [1000, 9999000], [31, 31], ['N', 'M'], keys=['n', 's'])
+    result = index.query_radius(1500, 500000, 0, 31, 'N')
+    assert [key for key, _ in result] == ['n', 's']
+
+
+def test_extend_per_point_zones():
+    index = GridIndex()
+    index.extend([500000, 500000], [1000, 9999000], [31, 31], northern=[True, False], keys=['n', 's'])
+    result = index.query_radius(1500, 500000, 0, 31, northern=True)
+    assert [key for key, _ in result] == ['n', 's']
+
+
+@pytest.mark.parametrize("west, east", [
+    ((78.0, 8.999), (78.0, 9.001)),  # 31X and 33X
+    ((78.0, 20.999), (78.0, 21.001)),  # 33X and 35X
+    ((78.0, 32.999), (78.0, 33.001)),  # 35X and 37X
+    ((60.0, 2.999), (60.0, 3.001)),  # 31V and 32V
+    ((72.0, 20.999), (71.999, 21.001)),  # 33X and 34W
+])
+def test_query_across_special_zones(west, east):
+    # The special zones of Norway and Svalbard also border zones whose
+    # numbers are two apart
+    index = GridIndex()
+    west = UTM.from_latlon(*west)
+    east = UTM.from_latlon(*east)
+    assert west[2] != east[2]
+    index.insert('west', *west)
+    index.insert('east', *east)
+
+    result = index.query_radius(500, *west)
+    assert [key for key, _ in result] == ['west', 'east']
+    assert result[1][1] < 150
+
+    result = index.query_radius(500, *east)
+    assert [key for key, _ in result] == ['east', 'west']
+    assert result[1][1] < 150
+
+
+def test_remove_last_point_of_zone():
+    index = GridIndex()
+    index.insert('a', *UTM.from_latlon(50, 5))
+    index.insert('b', *UTM.from_latlon(50, 5.001))
+    index.insert('c', *UTM.from_latlon(50, 6.001))
+    assert [key for key, _ in index.query_radius(500, *UTM.from_latlon(50, 6.0))] == ['c']
+
+    # Moving the only point of zone 32 into zone 31
+    index.remove('a')
+    index.insert('c', *UTM.from_latlon(50, 5.002))
+    assert index.query_radius(500, *UTM.from_latlon(50, 6.0)) == []
+    assert [key for key, _ in index.query_radius(500, *UTM.from_latlon(50, 5.001))] == ['b', 'c']
+
+
+def test_query_beyond_neighbour_zones():
+    # At 70 degrees north the radius spans several zones
+    a = UTM.from_latlon(70, 0.5)
+    b = UTM.from_latlon(70, 18.2)
+    query = UTM.from_latlon(70, 9.5)
+    assert (a[2], b[2], query[2]) == (31, 34, 32)
+
+    index = GridIndex()
+    index.insert('b', *b)
+    result = index.query_radius(600000, *query)
+    assert [key for key, _ in result] == ['b']
+    assert result[0][1] == pytest.approx(332000, rel=0.01)
+    assert index.nearest(1, *query) == result
+
+    index.insert('a', *a)
+    assert [key for key, _ in index.nearest(1, *query)] == ['b']
+    assert [key for key, _ in index.query_radius(600000, *query)] == ['b', 'a']
+
+
+def test_query_near_pole():
+    # The radius spans all longitudes
+    index = GridIndex()
+    index.insert('a', *UTM.from_latlon(83.9, 90))
+    result = index.query_radius(1000000, *UTM.from_latlon(83.9, 0))
+    assert [key for key, _ in result] == ['a']
+    assert result[0][1] == pytest.approx(959000, rel=0.01)
@@ -0,0 +1,98 @@
+import utm as UTM
+from utm import conversion
+
+import pytest
+
+try:
+    import numpy as np
+
+    use_numpy = True
+except ImportError:
+    use_numpy = False
+
+
+@pytest.fixture
+def stats():
+    conversion.reset_stats()
+    conversion.enable_instrumentation()
+    yield
+    conversion.disable_instrumentation()
+    conversion.reset_stats()
+
+
+def test_disabled_by_default():
+    assert not conversion.instrumentation.active
+    UTM.from_latlon(51.2, 7.5)
+    assert conversion.get_stats() == {}
+
+
+def test_scalar_counts(stats):
+    UTM.from_latlon(51.2, 7.5)
+    UTM.from_latlon(49.0, 8.4)
+    UTM.to_latlon(340000, 5710000, 32, 'U')
+
+    result = conversion.get_stats()
+    entry = result['from_latlon']['scalar']
+    assert entry['calls'] == 2
+    assert entry['points'] == 2
+    assert entry['seconds'] > 0
+    assert entry['batch_size_histogram'] == {1: 2}
+    assert sum(entry['time_histogram_us'].values()) == 2
+    assert result['to_latlon']['scalar']['calls'] == 1
+
+
+def test_out_of_range_counts(stats):
+    with pytest.raises(UTM.OutOfRangeError):
+        UTM.from_latlon(85, 0)
+    with pytest.raises(ValueError):
+        UTM.to_latlon(340000, 5710000, 32)
+
+    result = conversion.get_stats()
+    assert result['from_latlon']['scalar']['out_of_range_errors'] == 1
+    assert result['to_latlon']['scalar']['other_errors'] == 1
+
+
+def test_snapshot_is_a_copy(stats):
+    UTM.from_latlon(51.2, 7.5)
+    snapshot = conversion.get_stats()
+    UTM.from_latlon(51.2, 7.5)
+    assert snapshot['from_latlon']['scalar']['calls'] == 1
+
+
+@pytest.mark.skipif(not use_numpy, reason="numpy not installed")
+def test_numpy_batch_size(stats):
+    UTM.from_latlon(np.full(100, 51.2), np.full(100, 7.5))
+
+    entry = conversion.get_stats()['from_latlon']['numpy']
+    assert entry['points'] == 100
+    assert entry['batch_size_histogram'] == {128: 1}
+
+
+def test_hook():
+    events = []
+
+    def hook(**event):
+        events.append(event)
+
+    conversion.add_hook(hook)
+    try:
+        UTM.to_latlon(340000, 5710000, 32, 'U')
+    finally:
+        conversion.remove_hook(hook)
+    UTM.to_latlon(340000, 5710000, 32, 'U')
+
+    assert len(events) == 1
+    assert events[0]['function'] == 'to_latlon'
+    assert events[0]['backend'] == 'scalar'
+    assert events[0]['points'] == 1
+    assert events[0]['error'] is None
+    assert conversion.get_stats() == {}
+    assert not conversion.instrumentation.active
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [(0, 1), (0.5, 1), (1, 1), (1.5, 2), (2, 2), (3, 4), (4, 4), (5, 8), (1000, 1024)],
+)
+def test_bucket(value, expected):
+    assert conversion.instrumentation._bucket(value) == expected
@@ -0,0 +1,130 @@
+import utm as UTM
+
+import pytest
+
+np = pytest.importorskip("numpy")
+planar = pytest.importorskip("utm.planar")
+
+
+def test_project_across_equator():
+    easting, northing, zone_number, northern = planar.project([0.1, -0.1], [3, 3])
+    assert zone_number == 31
+    assert northern is True
+    assert northing[0] == pytest.approx(11053.0, abs=1)
+    assert northing[1] == pytest.approx(-11053.0, abs=1)
+    assert easting == pytest.approx([500000, 500000])
+
+
+def test_project_forced_zone():
+    easting, northing, zone_number, northern = planar.project([50, 50], [5.9, 6.1], zone_number=32)
+    expected = UTM.from_latlon(np.array([50, 50]), np.array([5.9, 6.1]), force_zone_number=32)
+    assert zone_number == 32
+    assert np.allclose(easting, expected[0])
+    assert np.allclose(northing, expected[1])
+
+
+def test_to_common_zone():
+    lats = np.array([50.0, 50.0, 50.0])
+    lons = np.array([5.9, 6.1, 8.0])
+    zones = np.array([31, 32, 32])
+    easting = np.empty(3)
+    northing = np.empty(3)
+    for i in range(3):
+        easting[i], northing[i], zone, _ = UTM.from_latlon(lats[i], lons[i])
+        assert zone == zones[i]
+
+    result = planar.to_common_zone(easting, northing, zones, True, target_zone_number=32)
+    expected = UTM.from_latlon(lats, lons, force_zone_number=32)
+    assert result[2:] == (32, True)
+    assert np.allclose(result[0], expected[0], rtol=0, atol=0.01)
+    assert np.allclose(result[1], expected[1], rtol=0, atol=0.01)
+    # The input is not modified
+    assert easting[1] == UTM.from_latlon(50.0, 6.1)[0]
+
+
+def test_to_common_zone_hemispheres():
+    easting = np.array([500000.0, 500000.0])
+    northing = np.array([1000.0, 9999000.0])
+    result = planar.to_common_zone(easting, northing, 31, np.array([True, False]))
+    assert result[3] is True
+    assert result[1] == pytest.approx([1000, -1000])
+
+    result = planar.to_common_zone(easting, northing, 31, np.array([True, False]), target_northern=False)
+    assert result[1] == pytest.approx([10001000, 9999000])
+
+
+def test_project_median_zone():
+    easting, northing, zone_number, northern = planar.project([50, 50, 50], [5.9, 6.1, 8.0])
+    assert zone_number == 32
+    # Around the antimeridian
+    assert planar.project([0, 0, 0], [179.0, -179.0, -177.0])[2] == 1
+    assert planar.project([0, 0, 0], [177.0, 179.0, -179.0])[2] == 60
+
+
+@pytest.mark.parametrize("lon", [20.0, 40.0, 90.0])
+def test_project_too_far(lon):
+    with pytest.raises(UTM.OutOfRangeError):
+        planar.project([10, 10], [3, lon], zone_number=31)
+    with pytest.raises(UTM.OutOfRangeError):
+        planar.project([10, 10, 10], [3, 3, lon])
+
+
+def test_to_common_zone_median_zone():
+    easting = np.full(3, 500000.0)
+    northing = np.full(3, 5000000.0)
+    result = planar.to_common_zone(easting, northing, np.array([31, 32, 32]), True)
+    assert result[2] == 32
+
+
+def test_to_common_zone_too_far():
+    easting = np.array([500000.0, 500000.0])
+    northing = np.array([1000000.0, 1000000.0])
+    with pytest.raises(UTM.OutOfRangeError):
+        planar.to_common_zone(easting, northing, np.array([31, 34]), True)
+
+    # The special zones of Svalbard are wider than the regular zones
+    east = UTM.from_latlon(78.0, 21.001)
+    west = UTM.from_latlon(78.0, 20.999)
+    result = planar.to_common_zone(np.array([west[0], east[0]]), np.array([west[1], east[1]]),
+                                   np.array([west[2], east[2]]), True, target_zone_number=35)
+    distance = planar.distances(result[0][0], result[1][0], result[0][1], result[1][1])
+    assert distance == pytest.approx(46.4, abs=0.5)
+    with pytest.raises(UTM.OutOfRangeError):
+        planar.to_common_zone(np.array([west[0]]), np.array([west[1]]), 33, True, target_zone_number=37)
+
+
+def test_distances():
+    assert planar.distances(0, 0, 3, 4) == 5
+    assert planar.distances(np.array([0, 1]), np.array([0, 1]), np.array([3, 1]), np.array([4, 2])) == \
+        pytest.approx([5, 1])
+
+
+def test_pairwise_distances():
+    matrix = planar.pairwise_distances([0, 3, 0], [0, 4, 1])
+    assert matrix.shape == (3, 3)
+    assert matrix[0, 1] == matrix[1, 0] == 5
+    assert np.all(np.diag(matrix) == 0)
+
+    matrix = planar.pairwise_distances([0, 3], [0, 4], [0], [1])
+    assert matrix.shape == (2, 1)
+
+
+def test_nearest(monkeypatch):
+    monkeypatch.setattr(planar, 'CHUNK_SIZE', 4)
+    easting = np.array([0.0, 10.0, 20.0])
+    northing = np.zeros(3)
+    index, distance = planar.nearest(easting, northing, [1, 19, 11, 30, -5], [0, 0, 1, 0, 0])
+    assert list(index) == [0, 2, 1, 2, 0]
+    assert distance == pytest.approx([1, 1, np.sqrt(2), 10, 5])
+
+
+def test_nearest_empty():
+    with pytest.raises(ValueError):
+        planar.nearest([], [], [0], [0])
+
+
+def test_bounding_box():
+    box = planar.bounding_box(np.array([3, 1, 2]), np.array([5, 6, 4]))
+    assert box == (1, 4, 3, 6)
+    inside = planar.in_box(np.array([1, 3, 0, 2]), np.array([4, 6, 5, 7]), box)
+    assert list(inside) == [True, True, False, False]
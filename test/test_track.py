@@ -0,0 +1,119 @@
+import utm as UTM
+from utm.track import TrackConverter
+
+import pytest
+
+try:
+    import numpy as np
+
+    use_numpy = True
+except ImportError:
+    use_numpy = False
+
+
+def assert_utm_close(a, b):
+    assert a[0] == pytest.approx(b[0], abs=1e-6)
+    assert a[1] == pytest.approx(b[1], abs=1e-6)
+    assert tuple(a[2:]) == tuple(b[2:])
+
+
+# Crosses from zone 31 into zone 32, into the special zone 32V of Norway, back
+# into zone 31 and across the equator
+track = [(50.0, 5.9), (50.0, 5.99), (50.0, 6.01), (50.0, 6.1), (56.5, 6.1), (56.5, 2.9), (-0.1, 3.0)]
+
+
+@pytest.mark.parametrize("lat, lon", track)
+def test_append_matches_from_latlon(lat, lon):
+    converter = TrackConverter()
+    for point in track:
+        converter.append(*point)
+    assert_utm_close(converter.append(lat, lon), UTM.from_latlon(lat, lon))
+
+
+def test_append_track():
+    converter = TrackConverter()
+    for lat, lon in track:
+        assert_utm_close(converter.append(lat, lon), UTM.from_latlon(lat, lon))
+
+
+def test_hysteresis():
+    converter = TrackConverter(hysteresis=0.1)
+    assert converter.append(50.0, 5.9)[2] == 31
+    # Within 0.1 degrees past the border: stay in zone 31
+    result = converter.append(50.0, 6.05)
+    assert_utm_close(result, UTM.from_latlon(50.0, 6.05, force_zone_number=31))
+    # Also across a band border
+    assert converter.append(48.0, 6.05)[2:] == (31, 'U')
+    assert converter.append(47.9, 6.05)[2:] == (31, 'T')
+    # Further away: switch to zone 32 and stay there
+    assert converter.append(47.9, 6.2)[2] == 32
+    assert converter.append(47.9, 5.95)[2] == 32
+    assert converter.append(47.9, 5.85)[2] == 31
+
+
+def test_hysteresis_band_transitions():
+    # Zone 32 does not exist in band X
+    converter = TrackConverter(hysteresis=0.5)
+    assert converter.append(70.0, 7.0)[2:] == (32, 'W')
+    assert converter.append(73.0, 7.0)[2:] == (31, 'X')
+
+    # Zone 31 is only 3 degrees wide in band V
+    converter = TrackConverter(hysteresis=0.1)
+    assert converter.append(55.9, 4.0)[2:] == (31, 'U')
+    assert converter.append(56.5, 4.0)[2:] == (32, 'V')
+    assert converter.append(56.5, 4.0)[2:] == (32, 'V')
+
+    # Within the hysteresis of zone 33X, which is wider than zone 33W
+    converter = TrackConverter(hysteresis=0.1)
+    assert converter.append(71.9, 17.9)[2:] == (33, 'W')
+    assert converter.append(72.1, 20.95)[2:] == (33, 'X')
+    assert converter.append(72.1, 21.2)[2:] == (35, 'X')
+    assert converter.append(71.9, 21.2)[2:] == (34, 'W')
+
+
+def test_hysteresis_antimeridian():
+    converter = TrackConverter(hysteresis=0.1)
+    assert converter.append(0.1, 179.95)[2] == 60
+    assert converter.append(0.1, -179.95)[2] == 60
+    assert converter.append(0.1, -179.8)[2] == 1
+
+
+def test_reset():
+    converter = TrackConverter(hysteresis=1)
+    converter.append(50.0, 5.9)
+    converter.reset()
+    assert converter.zone_number is None
+    assert converter.append(50.0, 6.5)[2] == 32
+
+
+@pytest.mark.parametrize("lat, lon", [(85, 0), (-81, 0), (0, 181)])
+def test_out_of_range(lat, lon):
+    with pytest.raises(UTM.OutOfRangeError):
+        TrackConverter().append(lat, lon)
+
+
+def test_negative_hysteresis():
+    with pytest.raises(ValueError):
+        TrackConverter(hysteresis=-1)
+
+
+def test_extend():
+    lats, lons = zip(*track)
+    easting, northing, zone_numbers, zone_letters = TrackConverter().extend(lats, lons)
+    for i, (lat, lon) in enumerate(track):
+        assert_utm_close((easting[i], northing[i], zone_numbers[i], zone_letters[i]), UTM.from_latlon(lat, lon))
+
+
+@pytest.mark.skipif(not use_numpy, reason="numpy not installed")
+def test_extend_numpy():
+    lats, lons = (np.array(values) for values in zip(*track))
+    result = TrackConverter().extend(lats, lons)
+    assert isinstance(result[0], np.ndarray)
+    assert list(result[2]) == [31, 31, 32, 32, 32, 31, 31]
+    assert list(result[3]) == ['U', 'U', 'U', 'U', 'V', 'V', 'M']
+
+
+def test_extend_empty():
+    result = TrackConverter().extend([], [])
+    assert [len(values) for values in result] == [0, 0, 0, 0]
+
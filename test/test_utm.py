@@ -1,4 +1,5 @@
 import utm as UTM
+from utm.conversion import zone_longitudes, band_latitudes
 
 import functools
 import pytest
@@ -511,3 +512,103 @@ def test_zone_number_to_central_longitude(zone_number, expected_lon):
 def test_zone_letter_to_central_latitude(zone_letter, expected_lat):
     lat = UTM.zone_letter_to_central_latitude(zone_letter)
     assert lat == expected_lat
+
+
+@pytest.mark.parametrize(
+    "lat, lon, zone_number, target_zone_number",
+    [
+        (50.77535, 6.08389, 32, 31),
+        (50.77535, 5.9, 31, 32),
+        (-41.28646, 174.77624, 60, 59),
+        (0.5, 179.5, 60, 1),
+        (-0.5, -179.5, 1, 60),
+        (79.45574, 18.76338, 33, 34),
+    ],
+)
+def test_reproject(lat, lon, zone_number, target_zone_number):
+    utm = UTM.from_latlon(lat, lon, force_zone_number=zone_number)
+    # reproject() must match the two-step path through latitude/longitude
+    expected = UTM.from_latlon(*UTM.to_latlon(*utm), force_zone_number=target_zone_number,
+                               force_zone_letter=utm[3])
+
+    result = UTM.reproject(*utm[:3], target_zone_number, utm[3])
+    assert result[0] == pytest.approx(expected[0], abs=1e-6)
+    assert result[1] == pytest.approx(expected[1], abs=1e-6)
+    assert result[2:] == (target_zone_number, utm[3])
+
+
+def test_reproject_same_zone():
+    result = UTM.reproject(294409, 5628898, 32, 32, northern=True)
+    assert result[0] == pytest.approx(294409, abs=1e-3)
+    assert result[1] == pytest.approx(5628898, abs=1e-3)
+    assert result[2:] == (32, None)
+
+
+def test_reproject_invalid_zone():
+    with pytest.raises(UTM.OutOfRangeError):
+        UTM.reproject(294409, 5628898, 32, 61, 'U')
+
+
+@pytest.mark.skipif(not use_numpy, reason="numpy not installed")
+def test_reproject_numpy():
+    lats = np.array([50.7, 50.8, 50.9])
+    lons = np.array([5.5, 6.0, 6.5])
+    easting, northing, _, _ = UTM.from_latlon(lats, lons, force_zone_number=32)
+    expected = UTM.from_latlon(*UTM.to_latlon(easting, northing, 32, 'U'), force_zone_number=31)
+
+    result = UTM.reproject(easting, northing, 32, 31, 'U')
+    assert np.allclose(result[0], expected[0], rtol=0, atol=1e-6)
+    assert np.allclose(result[1], expected[1], rtol=0, atol=1e-6)
+
+
+@pytest.mark.parametrize("latlon, utm, utm_kw", known_values)
+def test_scale_convergence(latlon, utm, utm_kw):
+    result = UTM.from_latlon(*latlon, scale_convergence=True)
+    assert result[:4] == UTM.from_latlon(*latlon)
+    scale, convergence = result[4:]
+
+    inverse = UTM.to_latlon(*result[:4], scale_convergence=True)
+    assert inverse[:2] == UTM.to_latlon(*result[:4])
+    assert inverse[2] == pytest.approx(scale, abs=1e-7)
+    assert inverse[3] == pytest.approx(convergence, abs=1e-6)
+
+
+def test_scale_convergence_values():
+    # On the central meridian
+    _, _, _, _, scale, convergence = UTM.from_latlon(50, 9, scale_convergence=True)
+    assert scale == pytest.approx(0.9996, abs=1e-12)
+    assert convergence == pytest.approx(0, abs=1e-12)
+
+    # Aachen, 2.9 degrees west of the central meridian of zone 32
+    _, _, _, _, scale, convergence = UTM.from_latlon(50.77535, 6.08389, scale_convergence=True)
+    assert scale == pytest.approx(1.000119, abs=1e-6)
+    assert convergence == pytest.approx(-2.2598, abs=1e-4)
+
+
+@pytest.mark.skipif(not use_numpy, reason="numpy not installed")
+def test_scale_convergence_numpy():
+    lats = np.array([50.0, 51.0, 52.0])
+    lons = np.array([6.0, 7.0, 8.0])
+    result = UTM.from_latlon(lats, lons, scale_convergence=True)
+    for i in range(3):
+        expected = UTM.from_latlon(lats[i], lons[i], scale_convergence=True)
+        assert result[4][i] == pytest.approx(expected[4])
+        assert result[5][i] == pytest.approx(expected[5])
+
+    inverse = UTM.to_latlon(result[0], result[1], 32, 'U', scale_convergence=True)
+    assert np.allclose(inverse[2], result[4], rtol=0, atol=1e-7)
+    assert np.allclose(inverse[3], result[5], rtol=0, atol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "zone_number, zone_letter, expected",
+    [(32, 'U', (6, 12)), (32, 'V', (3, 12)), (31, 'V', (0, 3)), (33, 'X', (9, 21)), (1, 'C', (-180, -174))],
+)
+def test_zone_longitudes(zone_number, zone_letter, expected):
+    assert zone_longitudes(zone_number, zone_letter) == expected
+
+
+def test_band_latitudes():
+    assert band_latitudes('C') == (-80, -72)
+    assert band_latitudes('N') == (0, 8)
+    assert band_latitudes('X') == (72, 84)
@@ -1,3 +1,4 @@
-from utm.conversion import to_latlon, from_latlon, latlon_to_zone_number, latitude_to_zone_letter, check_valid_zone, zone_number_to_central_longitude, zone_letter_to_central_latitude
+from utm.conversion import to_latlon, from_latlon, reproject, latlon_to_zone_number, latitude_to_zone_letter, check_valid_zone, zone_number_to_central_longitude, zone_letter_to_central_latitude
 from utm.error import OutOfRangeError
 from utm._version import __version__
+from utm.coordinates import UTMCoord, LatLon, UTMArray, LatLonArray
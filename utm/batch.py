@@ -0,0 +1,260 @@
+"""Multi-process conversion of large coordinate files
+
+The input file is split into shards at record boundaries (for binary files)
+or line boundaries (for CSV files). Every shard is converted in a worker
+process with the vectorized functions of ``utm.bulk``.
+
+CSV files contain one point per line, either ``latitude,longitude`` or
+``easting,northing,zone_number,zone_letter``. Like the binary formats, every
+point gets its own zone. This module requires NumPy.
+"""
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from utm import bulk, instrumentation
+from utm.conversion import check_valid_zone_letter, ZONE_LETTERS
+
+__all__ = ['convert_file_parallel', 'shard_ranges', 'part_path']
+
+# Number of shards per worker process, more shards give finer progress
+SHARDS_PER_JOB = 4
+
+# Size of the blocks that are read from CSV files at once
+BLOCK_SIZE = 1 << 24
+
+_ZONE_LETTERS = np.array(list(ZONE_LETTERS))
+
+
+def _format(path, format):
+    if format is None and os.path.splitext(str(path))[1] in ('.csv', '.txt'):
+        return 'csv'
+    if format == 'csv':
+        return format
+    return bulk._format(path, format)
+
+
+def part_path(path, index):
+    """Returns the path of the output file of a single shard"""
+    base, extension = os.path.splitext(path)
+    return '%s.%04d%s' % (base, index, extension)
+
+
+def shard_ranges(path, shards, format=None, fields=None):
+    """Splits a file into at most ``shards`` ranges
+
+    Returns a list of ``(start, end)`` tuples. For CSV files these are byte
+    offsets aligned to the start of a line, for binary files these are
+    record indices, in which case ``fields`` must be given.
+    """
+    format = _format(path, format)
+    if format != 'csv':
+        count = len(bulk.open_records(path, fields, format))
+        bounds = [count * i // shards for i in range(shards + 1)]
+        return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, 'rb') as f:
+        for i in range(1, shards):
+            position = max(size * i // shards, bounds[-1])
+            if position == 0:
+                continue
+            # Move to the start of the next line, or stay if this already is one
+            f.seek(position - 1)
+            f.readline()
+            bounds.append(min(f.tell(), size))
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+
+def _read_lines(path, start, end):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        rest = b''
+        while remaining > 0:
+            block = f.read(min(BLOCK_SIZE, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            block = rest + block
+            if remaining > 0:
+                # Keep the incomplete last line for the next block
+                last = block.rfind(b'\n') + 1
+                block, rest = block[:last], block[last:]
+            else:
+                rest = b''
+            lines = [line for line in block.decode('ascii').splitlines() if line.strip()]
+            if lines:
+                yield lines
+        if rest.strip():
+            yield [rest.decode('ascii')]
+
+
+def _convert_lines(lines, direction):
+    fields = [line.split(',') for line in lines]
+    if direction == 'latlon':
+        points = np.array(fields, dtype=float).reshape(-1, bulk.LATLON_FIELDS)
+        records = bulk.from_latlon_records(points)
+        letters = _ZONE_LETTERS[(points[:, 0] + 80).astype(int) >> 3]
+        return ''.join('%r,%r,%d,%s\n' % (easting, northing, zone_number, letter)
+                       for (easting, northing, zone_number, _), letter in zip(records.tolist(), letters))
+
+    records = np.empty((len(fields), bulk.UTM_FIELDS))
+    for i, (easting, northing, zone_number, zone_letter) in enumerate(fields):
+        zone_letter = zone_letter.strip().upper()
+        check_valid_zone_letter(zone_letter)
+        records[i] = easting, northing, zone_number, zone_letter >= 'N'
+    result = bulk.to_latlon_records(records)
+    return ''.join('%r,%r\n' % tuple(point) for point in result.tolist())
+
+
+def _convert_shard(task):
+    """Converts a single shard in a worker process, returns the number of points and the duration"""
+    index, (start, end), source, target, direction, format, target_format, split_output = task
+    begin = time.perf_counter()
+
+    if format == 'csv':
+        count = 0
+        # CSV output has no fixed record size, so every shard writes its own file
+        with open(part_path(target, index), 'w') as f:
+            for lines in _read_lines(source, start, end):
+                f.write(_convert_lines(lines, direction))
+                count += len(lines)
+        return index, count, time.perf_counter() - begin
+
+    source_fields, target_fields = bulk.FIELDS[direction]
+    records = bulk.open_records(source, source_fields, format)
+    if split_output:
+        output = bulk.create_records(part_path(target, index), end - start, target_fields, target_format)
+        bulk.convert_records(records[start:end], output, direction)
+    else:
+        if bulk._format(target, target_format) == 'npy':
+            output = np.load(target, mmap_mode='r+')
+        else:
+            output = np.memmap(target, dtype=bulk.DTYPE, mode='r+').reshape(-1, target_fields)
+        bulk.convert_records(records, output, direction, start, end)
+    output.flush()
+    return index, end - start, time.perf_counter() - begin
+
+
+def convert_file_parallel(source, target, direction, format=None, target_format=None, jobs=None,
+                          split_output=False, progress=None):
+    """Converts a coordinate file with multiple worker processes
+
+        Parameters
+        ----------
+        source: str
+            Path of the input file
+
+        target: str
+            Path of the output file. With ``split_output``, every shard is
+            written to its own file instead, named like ``target`` with the
+            shard number before the extension (see ``part_path()``)
+
+        direction: str
+            ``'latlon'`` to convert latitude/longitude to UTM, ``'utm'`` for
+            the opposite direction
+
+        format: str
+            ``'csv'``, ``'npy'`` or ``'raw'``. Default is determined by the
+            file extension (``.csv``/``.txt``, ``.npy``, anything else)
+
+        target_format: str
+            Format of binary output files, determined like ``format`` by
+            default. CSV input is always written as CSV
+
+        jobs: int
+            Number of worker processes. Default is the number of CPUs
+
+        split_output: bool
+            Write one output file per shard instead of a single file
+
+        progress: callable
+            Called as ``progress(points, seconds)`` after every shard with the
+            number of points converted so far and the elapsed time
+
+        Returns
+        -------
+        count: int
+            Number of converted points
+
+        paths: list
+            Paths of the written output files
+    """
+    if direction not in bulk.FIELDS:
+        raise ValueError('direction must be "latlon" or "utm"')
+    format = _format(source, format)
+    jobs = jobs or os.cpu_count() or 1
+    source_fields, target_fields = bulk.FIELDS[direction]
+
+    if format == 'csv':
+        target_format = 'csv'
+    else:
+        target_format = bulk._format(target, target_format)
+
+    ranges = shard_ranges(source, jobs * SHARDS_PER_JOB if jobs > 1 else 1, format, source_fields)
+    if format != 'csv' and not split_output:
+        count = len(bulk.open_records(source, source_fields, format))
+        bulk.create_records(target, count, target_fields, target_format).flush()
+
+    workdir = None
+    shard_target = target
+    if format == 'csv' and not split_output:
+        # The CSV shards are written into a directory of their own, so they
+        # can be removed on errors without touching files of earlier runs
+        workdir = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(target)))
+        shard_target = os.path.join(workdir, os.path.basename(target))
+
+    tasks = [(index, shard, source, shard_target, direction, format, target_format, split_output)
+             for index, shard in enumerate(ranges)]
+
+    function = 'from_latlon' if direction == 'latlon' else 'to_latlon'
+    start = time.perf_counter()
+    count = 0
+
+    def done(result):
+        nonlocal count
+        _, points, seconds = result
+        count += points
+        if instrumentation.active:
+            instrumentation.record(function, 'parallel', points, seconds)
+        if progress is not None:
+            progress(count, time.perf_counter() - start)
+
+    try:
+        if jobs > 1 and len(tasks) > 1:
+            with multiprocessing.Pool(jobs) as pool:
+                for result in pool.imap_unordered(_convert_shard, tasks):
+                    done(result)
+        else:
+            for task in tasks:
+                done(_convert_shard(task))
+
+        if workdir is not None:
+            concatenate([part_path(shard_target, index) for index in range(len(tasks))], target)
+    finally:
+        if workdir is not None:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    if split_output:
+        return count, [part_path(target, index) for index in range(len(tasks))]
+    return count, [target]
+
+
+def concatenate(paths, target):
+    """Joins the CSV output files of the shards into one file"""
+    if len(paths) == 1:
+        os.replace(paths[0], target)
+        return
+
+    with open(target, 'wb') as output:
+        for path in paths:
+            with open(path, 'rb') as f:
+                shutil.copyfileobj(f, output)
+            os.remove(path)
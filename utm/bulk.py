@@ -0,0 +1,191 @@
+"""Bulk conversion of binary coordinate files
+
+Coordinates are stored as records of little-endian float64 values, either
+as raw packed records or as ``.npy`` files:
+
+* latitude/longitude records: ``(latitude, longitude)``
+* UTM records: ``(easting, northing, zone_number, northern)``, where
+  ``northern`` is 1.0 for the northern and 0.0 for the southern hemisphere
+
+Unlike ``from_latlon``, every record gets its own zone. Files are memory
+mapped and converted chunk by chunk, so they can be larger than memory.
+This module requires NumPy.
+"""
+import os
+
+import numpy as np
+
+from utm.conversion import _forward, _inverse, mod_angle
+from utm.error import OutOfRangeError
+from utm import instrumentation
+
+__all__ = ['latlon_to_zone_numbers', 'from_latlon_records', 'to_latlon_records', 'open_records',
+           'create_records', 'convert_records', 'convert_file']
+
+DTYPE = np.dtype('<f8')
+LATLON_FIELDS = 2
+UTM_FIELDS = 4
+FIELDS = {'latlon': (LATLON_FIELDS, UTM_FIELDS), 'utm': (UTM_FIELDS, LATLON_FIELDS)}
+
+CHUNK_SIZE = 1 << 20
+
+
+def latlon_to_zone_numbers(latitude, longitude):
+    """Vectorized ``latlon_to_zone_number``, returning the zone of every point"""
+    latitude = np.asarray(latitude)
+    longitude = (np.asarray(longitude) % 360 + 540) % 360 - 180
+
+    zone_number = ((longitude + 180) / 6).astype(int) + 1
+
+    # Special zone for Norway
+    zone_number[(56 <= latitude) & (latitude < 64) & (3 <= longitude) & (longitude < 12)] = 32
+
+    # Special zones for Svalbard
+    svalbard = (72 <= latitude) & (latitude <= 84) & (longitude >= 0)
+    zone_number[svalbard & (longitude < 9)] = 31
+    zone_number[svalbard & (9 <= longitude) & (longitude < 21)] = 33
+    zone_number[svalbard & (21 <= longitude) & (longitude < 33)] = 35
+    zone_number[svalbard & (33 <= longitude) & (longitude < 42)] = 37
+
+    return zone_number
+
+
+def from_latlon_records(records, out=None):
+    """Converts an ``(N, 2)`` array of latitude/longitude records into ``(N, 4)`` UTM records"""
+    latitude = records[:, 0]
+    longitude = records[:, 1]
+    if not (np.all(latitude >= -80) and np.all(latitude <= 84)):
+        raise OutOfRangeError('latitude out of range (must be between 80 deg S and 84 deg N)')
+    if not (np.all(longitude >= -180) and np.all(longitude <= 180)):
+        raise OutOfRangeError('longitude out of range (must be between 180 deg W and 180 deg E)')
+
+    if out is None:
+        out = np.empty((len(records), UTM_FIELDS))
+
+    zone_number = latlon_to_zone_numbers(latitude, longitude)
+    central_lon = np.radians((zone_number - 1) * 6 - 180 + 3)
+    northern = latitude >= 0
+
+    easting, northing = _forward(np.radians(latitude), mod_angle(np.radians(longitude) - central_lon))
+    out[:, 0] = easting
+    out[:, 1] = np.where(northern, northing, northing + 10000000)
+    out[:, 2] = zone_number
+    out[:, 3] = northern
+    return out
+
+
+def to_latlon_records(records, out=None, strict=True):
+    """Converts an ``(N, 4)`` array of UTM records into ``(N, 2)`` latitude/longitude records"""
+    easting = records[:, 0]
+    northing = records[:, 1]
+    zone_number = records[:, 2]
+    northern = records[:, 3] != 0
+    if strict:
+        if not (np.all(easting >= 100000) and np.all(easting < 1000000)):
+            raise OutOfRangeError('easting out of range (must be between 100,000 m and 999,999 m)')
+        if not (np.all(northing >= 0) and np.all(northing <= 10000000)):
+            raise OutOfRangeError('northing out of range (must be between 0 m and 10,000,000 m)')
+    if not (np.all(zone_number >= 1) and np.all(zone_number <= 60)):
+        raise OutOfRangeError('zone number out of range (must be between 1 and 60)')
+    if np.any(zone_number != np.floor(zone_number)):
+        raise OutOfRangeError('zone number must be an integer')
+
+    if out is None:
+        out = np.empty((len(records), LATLON_FIELDS))
+
+    latitude, longitude = _inverse(easting - 500000, np.where(northern, northing, northing - 10000000))
+    central_lon = np.radians((zone_number - 1) * 6 - 180 + 3)
+    out[:, 0] = np.degrees(latitude)
+    out[:, 1] = np.degrees(mod_angle(longitude + central_lon))
+    return out
+
+
+def _format(path, format):
+    if format is None:
+        format = 'npy' if str(path).endswith('.npy') else 'raw'
+    if format not in ('npy', 'raw'):
+        raise ValueError('format must be "npy" or "raw"')
+    return format
+
+
+def open_records(path, fields, format=None):
+    """Memory maps a file of records with ``fields`` values each for reading"""
+    if _format(path, format) == 'npy':
+        records = np.load(path, mmap_mode='r')
+        if records.ndim != 2 or records.shape[1] != fields or records.dtype != DTYPE:
+            raise ValueError('%s does not contain (N, %d) float64 records' % (path, fields))
+        return records
+
+    size = os.path.getsize(path)
+    if size % (fields * DTYPE.itemsize):
+        raise ValueError('%s does not contain %d-value float64 records' % (path, fields))
+    if size == 0:
+        return np.empty((0, fields), dtype=DTYPE)
+    return np.memmap(path, dtype=DTYPE, mode='r', shape=(size // (fields * DTYPE.itemsize), fields))
+
+
+def create_records(path, count, fields, format=None):
+    """Creates a file of ``count`` records and memory maps it for writing"""
+    if _format(path, format) == 'npy':
+        return np.lib.format.open_memmap(path, mode='w+', dtype=DTYPE, shape=(count, fields))
+
+    with open(path, 'wb') as f:
+        f.truncate(count * fields * DTYPE.itemsize)
+    if count == 0:
+        return np.empty((0, fields), dtype=DTYPE)
+    return np.memmap(path, dtype=DTYPE, mode='r+', shape=(count, fields))
+
+
+def convert_records(source, target, direction, start=0, end=None, chunk_size=CHUNK_SIZE):
+    """Converts the records ``start:end`` of ``source`` into ``target``"""
+    convert = from_latlon_records if direction == 'latlon' else to_latlon_records
+    end = len(source) if end is None else end
+    for chunk_start in range(start, end, chunk_size):
+        chunk_end = min(chunk_start + chunk_size, end)
+        convert(np.asarray(source[chunk_start:chunk_end]), out=target[chunk_start:chunk_end])
+
+
+def convert_file(source, target, direction, format=None, target_format=None, chunk_size=CHUNK_SIZE):
+    """Converts a binary file of records
+
+        Parameters
+        ----------
+        source: str
+            Path of the input file
+
+        target: str
+            Path of the output file, which is overwritten
+
+        direction: str
+            ``'latlon'`` to convert latitude/longitude records to UTM records,
+            ``'utm'`` for the opposite direction
+
+        format: str
+            ``'npy'`` or ``'raw'``. Default is ``'npy'`` for ``.npy`` files
+            and ``'raw'`` otherwise
+
+        target_format: str
+            Format of the output file, determined like ``format`` by default
+
+        Returns
+        -------
+        count: int
+            Number of converted records
+    """
+    if direction not in FIELDS:
+        raise ValueError('direction must be "latlon" or "utm"')
+    source_fields, target_fields = FIELDS[direction]
+
+    records = open_records(source, source_fields, format)
+    output = create_records(target, len(records), target_fields, target_format)
+
+    function = 'from_latlon' if direction == 'latlon' else 'to_latlon'
+    if instrumentation.active:
+        instrumentation.measure(function, convert_records, records[:, 0],
+                                records, output, direction, 0, len(records), chunk_size)
+    else:
+        convert_records(records, output, direction, 0, len(records), chunk_size)
+
+    if isinstance(output, np.memmap):
+        output.flush()
+    return len(records)
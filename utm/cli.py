@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import argparse
+import sys
 import utm
 
 parser = argparse.ArgumentParser(description='Bidirectional UTM-WGS84 converter for python')
@@ -16,9 +17,38 @@ parser_utm.add_argument('northing', type=int, help='Northing component of the UT
 parser_utm.add_argument('zone_number', type=int, help='Zone number of the UTM coordinate')
 parser_utm.add_argument('zone_letter', help='Zone letter of the UTM coordinate')
 
+parser_file = subparsers.add_parser('file', help='Convert a file of coordinates')
+parser_file.add_argument('direction', choices=['latlon', 'utm'],
+                         help='latlon: convert latitude/longitude to UTM, utm: the opposite')
+parser_file.add_argument('input', help='Input file: CSV lines, float64 records as .npy file '
+                                       'or raw packed little-endian float64 records')
+parser_file.add_argument('output', help='Output file. CSV input is written as CSV, binary output is written in '
+                                        'the format given by --output-format or the file extension')
+parser_file.add_argument('--format', choices=['csv', 'npy', 'raw'],
+                         help='Format of the input file (default: csv for .csv/.txt files, npy for .npy files, '
+                              'raw otherwise)')
+parser_file.add_argument('--output-format', choices=['npy', 'raw'],
+                         help='Format of binary output files (default: npy for .npy files, raw otherwise)')
+parser_file.add_argument('--jobs', type=int,
+                         help='Split the input into shards and convert them in JOBS worker processes')
+parser_file.add_argument('--split-output', action='store_true',
+                         help='Write one output file per shard instead of a single output file')
+
 args = parser.parse_args()
 
-if all(arg in args for arg in ['easting', 'northing', 'zone_number', 'zone_letter']):
+if 'input' in args:
+    from utm import batch
+
+    def progress(points, seconds):
+        sys.stderr.write('\r%d points converted, %.0f points/s' % (points, points / seconds if seconds else 0))
+        sys.stderr.flush()
+
+    batch.convert_file_parallel(args.input, args.output, args.direction, args.format, args.output_format,
+                                jobs=args.jobs or 1, split_output=args.split_output, progress=progress)
+    sys.stderr.write('\n')
+    exit()
+
+elif all(arg in args for arg in ['easting', 'northing', 'zone_number', 'zone_letter']):
     if args.zone_letter == '':
         parser_utm.print_usage()
         print("utm-converter utm: error: too few arguments")
@@ -1,4 +1,7 @@
 from utm.error import OutOfRangeError
+from utm import instrumentation
+from utm.instrumentation import (enable_instrumentation, disable_instrumentation, get_stats, reset_stats,
+                                 add_hook, remove_hook)
 
 # For most use cases in this module, numpy is indistinguishable
 # from math, except it also works on numpy arrays
@@ -9,7 +12,7 @@ except ImportError:
     import math as mathlib
     use_numpy = False
 
-__all__ = ['to_latlon', 'from_latlon']
+__all__ = ['to_latlon', 'from_latlon', 'reproject']
 
 K0 = 0.9996
 
@@ -76,7 +79,8 @@ def mod_angle(value):
     return (value + mathlib.pi) % (2 * mathlib.pi) - mathlib.pi
 
 
-def to_latlon(easting, northing, zone_number, zone_letter=None, northern=None, strict=True):
+def to_latlon(easting, northing, zone_number, zone_letter=None, northern=None, strict=True,
+              scale_convergence=False):
     """This function converts UTM coordinates to Latitude and Longitude
 
         Parameters
@@ -102,6 +106,10 @@ def to_latlon(easting, northing, zone_number, zone_letter=None, northern=None, s
         strict: bool
             Raise an OutOfRangeError if outside of bounds
 
+        scale_convergence: bool
+            Also return the point scale factor and the meridian convergence.
+            Default is False
+
         Returns
         -------
         latitude: float or NumPy array
@@ -110,10 +118,47 @@ def to_latlon(easting, northing, zone_number, zone_letter=None, northern=None, s
         longitude: float or NumPy array
             Longitude between 180 deg W and 180 deg E, e.g. (-180.0 to 180.0).
 
+        scale: float or NumPy array
+            Point scale factor, only returned if ``scale_convergence`` is set
+
+        convergence: float or NumPy array
+            Meridian convergence in degrees, i.e. the angle from true north to
+            grid north, only returned if ``scale_convergence`` is set
+
 
        .. _[1]: http://www.jaworski.ca/utmzones.htm
 
     """
+    if instrumentation.active:
+        return instrumentation.measure('to_latlon', _to_latlon, easting,
+                                       easting, northing, zone_number, zone_letter, northern, strict,
+                                       scale_convergence)
+    return _to_latlon(easting, northing, zone_number, zone_letter, northern, strict, scale_convergence)
+
+
+def _to_latlon(easting, northing, zone_number, zone_letter, northern, strict, scale_convergence):
+    northern = _check_utm_args(easting, northing, zone_number, zone_letter, northern, strict)
+
+    x = easting - 500000
+    y = northing if northern else northing - 10000000
+
+    result = _inverse(x, y, scale_convergence)
+    latitude, longitude = result[:2]
+
+    longitude = mod_angle(longitude + mathlib.radians(zone_number_to_central_longitude(zone_number)))
+
+    if scale_convergence:
+        return (mathlib.degrees(latitude),
+                mathlib.degrees(longitude),
+                result[2],
+                mathlib.degrees(result[3]))
+
+    return (mathlib.degrees(latitude),
+            mathlib.degrees(longitude))
+
+
+def _check_utm_args(easting, northing, zone_number, zone_letter, northern, strict):
+    """Validates UTM input arguments and returns the hemisphere"""
     if not zone_letter and northern is None:
         raise ValueError('either zone_letter or northern needs to be set')
     elif zone_letter and northern is not None:
@@ -131,29 +176,41 @@ def to_latlon(easting, northing, zone_number, zone_letter=None, northern=None, s
         zone_letter = zone_letter.upper()
         northern = (zone_letter >= 'N')
 
-    x = easting - 500000
-    y = northing if northern else northing - 10000000
+    return northern
 
+
+def _inverse(x, y, scale_convergence=False, lib=mathlib):
+    """Inverse projection kernel
+
+    Takes the distance from the central meridian ``x`` and the distance from
+    the equator ``y`` in metres and returns the latitude and the longitude
+    relative to the central meridian, both in radians. If
+    ``scale_convergence`` is set, the point scale factor and the meridian
+    convergence (in radians) are returned as well. ``lib`` can be set to the
+    ``math`` module for faster evaluation of plain numbers.
+    """
     m = y / K0
     mu = m / (R * M1)
 
-    p_rad = (mu +
-             P2 * mathlib.sin(2 * mu) +
-             P3 * mathlib.sin(4 * mu) +
-             P4 * mathlib.sin(6 * mu) +
-             P5 * mathlib.sin(8 * mu))
+    # Clenshaw summation of P2 * sin(2 mu) + ... + P5 * sin(8 mu), which only
+    # needs sin(2 mu) and cos(2 mu)
+    x2 = 2 * lib.cos(2 * mu)
+    b3 = P4 + x2 * P5
+    b2 = P3 + x2 * b3 - P5
+    b1 = P2 + x2 * b2 - b3
+    p_rad = mu + b1 * lib.sin(2 * mu)
 
-    p_sin = mathlib.sin(p_rad)
+    p_sin = lib.sin(p_rad)
     p_sin2 = p_sin * p_sin
 
-    p_cos = mathlib.cos(p_rad)
+    p_cos = lib.cos(p_rad)
 
     p_tan = p_sin / p_cos
     p_tan2 = p_tan * p_tan
     p_tan4 = p_tan2 * p_tan2
 
     ep_sin = 1 - E * p_sin2
-    ep_sin_sqrt = mathlib.sqrt(1 - E * p_sin2)
+    ep_sin_sqrt = lib.sqrt(1 - E * p_sin2)
 
     n = R / ep_sin_sqrt
     r = (1 - E) / ep_sin
@@ -177,13 +234,25 @@ def to_latlon(easting, northing, zone_number, zone_letter=None, northern=None, s
                  d3 / 6 * (1 + 2 * p_tan2 + c) +
                  d5 / 120 * (5 - 2 * c + 28 * p_tan2 - 3 * c2 + 8 * E_P2 + 24 * p_tan4)) / p_cos
 
-    longitude = mod_angle(longitude + mathlib.radians(zone_number_to_central_longitude(zone_number)))
+    if not scale_convergence:
+        return latitude, longitude
 
-    return (mathlib.degrees(latitude),
-            mathlib.degrees(longitude))
+    # Series in terms of the footpoint latitude, with psi = 1 / r being the
+    # ratio of the radii of curvature
+    psi = 1 / r
+    psi2 = psi * psi
+
+    scale = K0 * (1 + d2 / 2 * psi + d4 / 24 * psi2)
 
+    convergence = p_tan * (d -
+                           d3 / 3 * (-2 * psi2 + 3 * psi + p_tan2) +
+                           d5 / 15 * (2 + 5 * p_tan2 + 3 * p_tan4))
 
-def from_latlon(latitude, longitude, force_zone_number=None, force_zone_letter=None, force_northern=None):
+    return latitude, longitude, scale, convergence
+
+
+def from_latlon(latitude, longitude, force_zone_number=None, force_zone_letter=None, force_northern=None,
+                scale_convergence=False):
     """This function converts Latitude and Longitude to UTM coordinate
 
         Parameters
@@ -208,6 +277,10 @@ def from_latlon(latitude, longitude, force_zone_number=None, force_zone_letter=N
             forcing with a zone letter. When set, the returned zone_letter will
             be None. Default is None
 
+        scale_convergence: bool
+            Also return the point scale factor and the meridian convergence.
+            Default is False
+
         Returns
         -------
         easting: float or NumPy array
@@ -224,9 +297,24 @@ def from_latlon(latitude, longitude, force_zone_number=None, force_zone_letter=N
             Zone letter is represented by a string value. UTM zone designators
             can be accessed in [1]_
 
+        scale: float or NumPy array
+            Point scale factor, only returned if ``scale_convergence`` is set
+
+        convergence: float or NumPy array
+            Meridian convergence in degrees, i.e. the angle from true north to
+            grid north, only returned if ``scale_convergence`` is set
+
 
        .. _[1]: http://www.jaworski.ca/utmzones.htm
     """
+    if instrumentation.active:
+        return instrumentation.measure('from_latlon', _from_latlon, latitude,
+                                       latitude, longitude, force_zone_number, force_zone_letter, force_northern,
+                                       scale_convergence)
+    return _from_latlon(latitude, longitude, force_zone_number, force_zone_letter, force_northern, scale_convergence)
+
+
+def _from_latlon(latitude, longitude, force_zone_number, force_zone_letter, force_northern, scale_convergence):
     if not in_bounds(latitude, -80, 84):
         raise OutOfRangeError('latitude out of range (must be between 80 deg S and 84 deg N)')
     if not in_bounds(longitude, -180, 180):
@@ -236,14 +324,6 @@ def from_latlon(latitude, longitude, force_zone_number=None, force_zone_letter=N
     if force_zone_number is not None:
         check_valid_zone(force_zone_number, force_zone_letter)
 
-    lat_rad = mathlib.radians(latitude)
-    lat_sin = mathlib.sin(lat_rad)
-    lat_cos = mathlib.cos(lat_rad)
-
-    lat_tan = lat_sin / lat_cos
-    lat_tan2 = lat_tan * lat_tan
-    lat_tan4 = lat_tan2 * lat_tan2
-
     if force_zone_number is None:
         zone_number = latlon_to_zone_number(latitude, longitude)
     else:
@@ -259,24 +339,59 @@ def from_latlon(latitude, longitude, force_zone_number=None, force_zone_letter=N
     else:
         northern = force_northern
 
+    lat_rad = mathlib.radians(latitude)
     lon_rad = mathlib.radians(longitude)
     central_lon = zone_number_to_central_longitude(zone_number)
     central_lon_rad = mathlib.radians(central_lon)
 
-    n = R / mathlib.sqrt(1 - E * lat_sin**2)
+    result = _forward(lat_rad, mod_angle(lon_rad - central_lon_rad), scale_convergence)
+    easting, northing = result[:2]
+
+    check_signs = force_northern is None and force_zone_letter is None
+    if check_signs and mixed_signs(latitude):
+        raise ValueError("latitudes must all have the same sign")
+    elif not northern:
+        northing += 10000000
+
+    if scale_convergence:
+        return easting, northing, zone_number, zone_letter, result[2], mathlib.degrees(result[3])
+
+    return easting, northing, zone_number, zone_letter
+
+
+def _forward(lat_rad, lon_rad, scale_convergence=False, lib=mathlib):
+    """Forward projection kernel
+
+    Takes the latitude and the longitude relative to the central meridian,
+    both in radians, and returns the easting and the northing (without the
+    false northing of the southern hemisphere) in metres. If
+    ``scale_convergence`` is set, the point scale factor and the meridian
+    convergence (in radians) are returned as well. ``lib`` can be set to the
+    ``math`` module for faster evaluation of plain numbers.
+    """
+    lat_sin = lib.sin(lat_rad)
+    lat_cos = lib.cos(lat_rad)
+
+    lat_tan = lat_sin / lat_cos
+    lat_tan2 = lat_tan * lat_tan
+    lat_tan4 = lat_tan2 * lat_tan2
+
+    n = R / lib.sqrt(1 - E * lat_sin**2)
     c = E_P2 * lat_cos**2
 
-    a = lat_cos * mod_angle(lon_rad - central_lon_rad)
+    a = lat_cos * lon_rad
     a2 = a * a
     a3 = a2 * a
     a4 = a3 * a
     a5 = a4 * a
     a6 = a5 * a
 
-    m = R * (M1 * lat_rad -
-             M2 * mathlib.sin(2 * lat_rad) +
-             M3 * mathlib.sin(4 * lat_rad) -
-             M4 * mathlib.sin(6 * lat_rad))
+    # Clenshaw summation of -M2 * sin(2 lat) + M3 * sin(4 lat) - M4 * sin(6 lat),
+    # using sin(2 lat) and cos(2 lat) derived from lat_sin and lat_cos
+    x2 = 2 * (lat_cos - lat_sin) * (lat_cos + lat_sin)
+    b2 = M3 - x2 * M4
+    b1 = x2 * b2 + M4 - M2
+    m = R * (M1 * lat_rad + b1 * 2 * lat_sin * lat_cos)
 
     easting = K0 * n * (a +
                         a3 / 6 * (1 - lat_tan2 + c) +
@@ -285,13 +400,91 @@ def from_latlon(latitude, longitude, force_zone_number=None, force_zone_letter=N
     northing = K0 * (m + n * lat_tan * (a2 / 2 +
                                         a4 / 24 * (5 - lat_tan2 + 9 * c + 4 * c**2) +
                                         a6 / 720 * (61 - 58 * lat_tan2 + lat_tan4 + 600 * c - 330 * E_P2)))
-    check_signs = force_northern is None and force_zone_letter is None
-    if check_signs and mixed_signs(latitude):
-        raise ValueError("latitudes must all have the same sign")
-    elif not northern:
+    if not scale_convergence:
+        return easting, northing
+
+    scale = K0 * (1 +
+                  a2 / 2 * (1 + c) +
+                  a4 / 24 * (5 - 4 * lat_tan2 + 42 * c + 13 * c**2 - 28 * E_P2) +
+                  a6 / 720 * (61 - 148 * lat_tan2 + 16 * lat_tan4))
+
+    convergence = a * lat_tan * (1 +
+                                 a2 / 3 * (1 + 3 * c + 2 * c**2) +
+                                 a4 / 15 * (2 - lat_tan2))
+
+    return easting, northing, scale, convergence
+
+
+def reproject(easting, northing, zone_number, target_zone_number, zone_letter=None, northern=None, strict=True):
+    """This function moves UTM coordinates from one zone into another zone
+
+    The result is the same as ``to_latlon`` followed by ``from_latlon`` with
+    ``force_zone_number=target_zone_number``, but without converting to and
+    from degrees in between. The series are only accurate near the central
+    meridian, so the target zone should be the same or an adjacent zone.
+
+        Parameters
+        ----------
+        easting: int or NumPy array
+            Easting value of UTM coordinates
+
+        northing: int or NumPy array
+            Northing value of UTM coordinates
+
+        zone_number: int
+            Zone number of the input coordinates
+
+        target_zone_number: int
+            Zone number to project the coordinates into
+
+        zone_letter: str
+            Zone letter of the input coordinates. The zone letter is kept, as
+            moving into another zone does not change the hemisphere
+
+        northern: bool
+            You can set True (North) or False (South) as an alternative to
+            providing a zone letter. Default is None
+
+        strict: bool
+            Raise an OutOfRangeError if outside of bounds
+
+        Returns
+        -------
+        easting: float or NumPy array
+            Easting value in the target zone
+
+        northing: float or NumPy array
+            Northing value in the target zone
+
+        zone_number: int
+            The target zone number
+
+        zone_letter: str
+            The given zone letter, or None if ``northern`` was set
+    """
+    if instrumentation.active:
+        return instrumentation.measure('reproject', _reproject, easting,
+                                       easting, northing, zone_number, target_zone_number, zone_letter, northern,
+                                       strict)
+    return _reproject(easting, northing, zone_number, target_zone_number, zone_letter, northern, strict)
+
+
+def _reproject(easting, northing, zone_number, target_zone_number, zone_letter, northern, strict):
+    northern = _check_utm_args(easting, northing, zone_number, zone_letter, northern, strict)
+    check_valid_zone_number(target_zone_number)
+
+    y = northing if northern else northing - 10000000
+    latitude, longitude = _inverse(easting - 500000, y)
+
+    if target_zone_number != zone_number:
+        # Central meridians are 6 degrees apart
+        longitude = mod_angle(longitude + mathlib.radians((zone_number - target_zone_number) * 6))
+
+    easting, northing = _forward(latitude, longitude)
+    if not northern:
         northing += 10000000
 
-    return easting, northing, zone_number, zone_letter
+    return easting, northing, target_zone_number, zone_letter
 
 
 def latitude_to_zone_letter(latitude):
@@ -339,6 +532,37 @@ def zone_number_to_central_longitude(zone_number):
     check_valid_zone_number(zone_number)
     return (zone_number - 1) * 6 - 180 + 3
 
+
+# Longitude ranges of the special zones of Norway and Svalbard
+SPECIAL_ZONES = {
+    ('V', 31): (0, 3),
+    ('V', 32): (3, 12),
+    ('X', 31): (0, 9),
+    ('X', 33): (9, 21),
+    ('X', 35): (21, 33),
+    ('X', 37): (33, 42),
+}
+
+# Zones that do not exist in the Svalbard band
+MISSING_ZONES = {('X', 32), ('X', 34), ('X', 36)}
+
+
+def zone_longitudes(zone_number, zone_letter):
+    """Returns the western and eastern longitude of a UTM zone in a latitude band"""
+    special = SPECIAL_ZONES.get((zone_letter, zone_number))
+    if special is not None:
+        return special
+    west = zone_number_to_central_longitude(zone_number) - 3
+    return west, west + 6
+
+
+def band_latitudes(zone_letter):
+    """Returns the southern and northern latitude of a latitude band"""
+    south = -80 + ZONE_LETTERS.index(zone_letter) * 8
+    if zone_letter == 'X':
+        return south, 84
+    return south, south + 8
+
 def zone_letter_to_central_latitude(zone_letter):
     check_valid_zone_letter(zone_letter)
     zone_letter = zone_letter.upper()
@@ -0,0 +1,182 @@
+from array import array
+from collections import namedtuple
+
+from utm.conversion import to_latlon, from_latlon, reproject, check_valid_zone, use_numpy, mathlib
+
+__all__ = ['UTMCoord', 'LatLon', 'UTMArray', 'LatLonArray']
+
+
+class UTMCoord(namedtuple('UTMCoord', ['easting', 'northing', 'zone_number', 'zone_letter'])):
+    """A single UTM coordinate
+
+    Behaves exactly like the tuple returned by ``from_latlon`` so it can be
+    unpacked and indexed the same way.
+    """
+    __slots__ = ()
+
+    def to_latlon(self, northern=None, strict=True):
+        return LatLon(*to_latlon(self.easting, self.northing, self.zone_number,
+                                 self.zone_letter, northern=northern, strict=strict))
+
+
+class LatLon(namedtuple('LatLon', ['latitude', 'longitude'])):
+    """A single WGS84 coordinate
+
+    Behaves exactly like the tuple returned by ``to_latlon`` so it can be
+    unpacked and indexed the same way.
+    """
+    __slots__ = ()
+
+    def to_utm(self, force_zone_number=None, force_zone_letter=None, force_northern=None):
+        return UTMCoord(*from_latlon(self.latitude, self.longitude, force_zone_number,
+                                     force_zone_letter, force_northern))
+
+
+def _as_array(values):
+    if use_numpy:
+        return mathlib.asarray(values, dtype=float)
+    if isinstance(values, array) and values.typecode == 'd':
+        return values
+    return array('d', values)
+
+
+class UTMArray(object):
+    """A batch of UTM coordinates sharing one zone
+
+    Eastings and northings are kept in two flat arrays (NumPy arrays if
+    NumPy is installed, ``array.array`` otherwise), and the zone is stored
+    once for the whole batch. The zone is validated when the batch is
+    created, not when individual points are accessed.
+    """
+    __slots__ = ('easting', 'northing', 'zone_number', 'zone_letter', 'northern')
+
+    def __init__(self, easting, northing, zone_number, zone_letter=None, northern=None):
+        if not zone_letter and northern is None:
+            raise ValueError('either zone_letter or northern needs to be set')
+        elif zone_letter and northern is not None:
+            raise ValueError('set either zone_letter or northern, but not both')
+        check_valid_zone(zone_number, zone_letter)
+
+        self.easting = _as_array(easting)
+        self.northing = _as_array(northing)
+        if len(self.easting) != len(self.northing):
+            raise ValueError('easting and northing must have the same length')
+
+        self.zone_number = zone_number
+        self.zone_letter = zone_letter
+        self.northern = northern if zone_letter is None else zone_letter.upper() >= 'N'
+
+    def __len__(self):
+        return len(self.easting)
+
+    def __getitem__(self, index):
+        return UTMCoord(self.easting[index], self.northing[index], self.zone_number, self.zone_letter)
+
+    def __iter__(self):
+        for easting, northing in zip(self.easting, self.northing):
+            yield UTMCoord(easting, northing, self.zone_number, self.zone_letter)
+
+    def __repr__(self):
+        return 'UTMArray(%d points, zone_number=%r, zone_letter=%r, northern=%r)' % (
+            len(self), self.zone_number, self.zone_letter, self.northern)
+
+    def _zone_kwargs(self):
+        if self.zone_letter:
+            return {'zone_letter': self.zone_letter}
+        return {'northern': self.northern}
+
+    def to_latlon(self, strict=True):
+        """Converts the whole batch to a ``LatLonArray``"""
+        kwargs = self._zone_kwargs()
+        if len(self) == 0:
+            return LatLonArray([], [])
+
+        if use_numpy:
+            latitude, longitude = to_latlon(self.easting, self.northing, self.zone_number,
+                                            strict=strict, **kwargs)
+            return LatLonArray(latitude, longitude)
+
+        latitude = array('d')
+        longitude = array('d')
+        for easting, northing in zip(self.easting, self.northing):
+            lat, lon = to_latlon(easting, northing, self.zone_number, strict=strict, **kwargs)
+            latitude.append(lat)
+            longitude.append(lon)
+        return LatLonArray(latitude, longitude)
+
+    def reproject(self, target_zone_number, strict=True):
+        """Moves the whole batch into another zone, see ``utm.reproject()``"""
+        kwargs = self._zone_kwargs()
+        if use_numpy:
+            easting, northing, _, _ = reproject(self.easting, self.northing, self.zone_number,
+                                                target_zone_number, strict=strict, **kwargs)
+        else:
+            easting = array('d')
+            northing = array('d')
+            for e, n in zip(self.easting, self.northing):
+                e, n, _, _ = reproject(e, n, self.zone_number, target_zone_number, strict=strict, **kwargs)
+                easting.append(e)
+                northing.append(n)
+        return UTMArray(easting, northing, target_zone_number, **kwargs)
+
+
+class LatLonArray(object):
+    """A batch of WGS84 coordinates
+
+    Latitudes and longitudes are kept in two flat arrays (NumPy arrays if
+    NumPy is installed, ``array.array`` otherwise).
+    """
+    __slots__ = ('latitude', 'longitude')
+
+    def __init__(self, latitude, longitude):
+        self.latitude = _as_array(latitude)
+        self.longitude = _as_array(longitude)
+        if len(self.latitude) != len(self.longitude):
+            raise ValueError('latitude and longitude must have the same length')
+
+    def __len__(self):
+        return len(self.latitude)
+
+    def __getitem__(self, index):
+        return LatLon(self.latitude[index], self.longitude[index])
+
+    def __iter__(self):
+        for latitude, longitude in zip(self.latitude, self.longitude):
+            yield LatLon(latitude, longitude)
+
+    def __repr__(self):
+        return 'LatLonArray(%d points)' % len(self)
+
+    def to_utm(self, force_zone_number=None, force_zone_letter=None, force_northern=None):
+        """Converts the whole batch to a ``UTMArray``
+
+        Like ``from_latlon`` with NumPy arrays, the zone is determined by the
+        first point unless it is forced, and all points are projected into
+        that zone.
+        """
+        if len(self) == 0:
+            raise ValueError('cannot determine the zone of an empty batch')
+
+        if use_numpy:
+            easting, northing, zone_number, zone_letter = from_latlon(
+                self.latitude, self.longitude, force_zone_number, force_zone_letter, force_northern)
+            return UTMArray(easting, northing, zone_number, zone_letter,
+                            northern=force_northern if zone_letter is None else None)
+
+        latitude = self.latitude
+        longitude = self.longitude
+        if force_northern is None and force_zone_letter is None and \
+                min(latitude) < 0 <= max(latitude):
+            raise ValueError("latitudes must all have the same sign")
+
+        _, _, zone_number, zone_letter = from_latlon(
+            latitude[0], longitude[0], force_zone_number, force_zone_letter, force_northern)
+
+        easting = array('d')
+        northing = array('d')
+        for lat, lon in zip(latitude, longitude):
+            e, n, _, _ = from_latlon(lat, lon, zone_number, zone_letter, force_northern)
+            easting.append(e)
+            northing.append(n)
+        return UTMArray(easting, northing, zone_number, zone_letter,
+                        northern=force_northern if zone_letter is None else None)
@@ -0,0 +1,197 @@
+"""Spatial index over UTM coordinates"""
+import math
+
+from utm.conversion import (_check_utm_args, _forward, _inverse, mod_angle, zone_longitudes,
+                            zone_number_to_central_longitude, SPECIAL_ZONES, E, K0, R)
+
+__all__ = ['GridIndex']
+
+# Queries reproject the query point into every zone within the search
+# radius, which limits the radius to keep the reprojection accurate
+MAX_RADIUS = 1000000
+
+
+def _zone_range(zone_number):
+    """Returns the longitude range a zone covers in any latitude band"""
+    ranges = [zone_longitudes(zone_number, None)]
+    ranges += [special for (_, number), special in SPECIAL_ZONES.items() if number == zone_number]
+    return min(west for west, _ in ranges), max(east for _, east in ranges)
+
+
+def _touches(a, b):
+    return any(a[0] <= b[1] + shift and b[0] + shift <= a[1] for shift in (-360, 0, 360))
+
+
+_RANGES = {zone_number: _zone_range(zone_number) for zone_number in range(1, 61)}
+
+# Zones overlapping each one degree wide strip of longitude, starting at 180 deg W
+_STRIPS = [frozenset(zone_number for zone_number, zone_range in _RANGES.items()
+                     if _touches((west, west + 1), zone_range))
+           for west in range(-180, 180)]
+
+
+def _search_zones(latitude, longitude, radius):
+    """Returns the zones that may hold points within ``radius`` metres
+
+    ``latitude`` is in radians, ``longitude`` in degrees. The radius is
+    widened by the smallest scale factor and divided by the smallest radii
+    of curvature, so the longitude range is never too small.
+    """
+    radius /= K0
+    # A degree of longitude is shortest at the latitude farthest from the equator
+    latitude = abs(latitude) + radius / (R * (1 - E))
+    circumference = 2 * math.pi * R * math.cos(min(latitude, math.pi / 2))
+    if 2 * radius >= circumference:
+        return set(_RANGES)
+
+    half_width = 360 * radius / circumference
+    zones = set()
+    for strip in range(math.floor(longitude - half_width), math.floor(longitude + half_width) + 1):
+        zones |= _STRIPS[(strip + 180) % 360]
+    return zones
+
+
+class GridIndex(object):
+    """A uniform grid index over UTM points
+
+    Points are bucketed by ``(zone_number, easting // cell_size, northing //
+    cell_size)``, using northern hemisphere northings so the grid is
+    continuous across the equator. Every point is identified by a hashable
+    key.
+
+    Queries take the query point in any zone. Points in other zones within
+    the search radius are found by reprojecting the query point into those
+    zones, so distances are always measured in the zone of the stored point.
+    """
+
+    def __init__(self, cell_size=1000):
+        if cell_size <= 0:
+            raise ValueError('cell_size must be positive')
+        self.cell_size = cell_size
+        self._cells = {}
+        self._points = {}
+        # Number of points per zone, so queries only visit zones with points
+        self._zones = {}
+
+    def __len__(self):
+        return len(self._points)
+
+    def __contains__(self, key):
+        return key in self._points
+
+    def _cell(self, zone_number, x, y):
+        return zone_number, int(x // self.cell_size), int(y // self.cell_size)
+
+    def insert(self, key, easting, northing, zone_number, zone_letter=None, northern=None):
+        """Adds a point, replacing any point with the same key"""
+        northern = _check_utm_args(easting, northing, zone_number, zone_letter, northern, strict=False)
+        if key in self._points:
+            self.remove(key)
+
+        y = northing if northern else northing - 10000000
+        point = (zone_number, float(easting), float(y))
+        self._points[key] = point
+        self._cells.setdefault(self._cell(*point), {})[key] = point
+        self._zones[zone_number] = self._zones.get(zone_number, 0) + 1
+
+    def extend(self, easting, northing, zone_number, zone_letter=None, northern=None, keys=None):
+        """Adds a batch of points, e.g. the result of ``from_latlon``
+
+        ``zone_number``, ``zone_letter`` and ``northern`` may be given once
+        for the whole batch or for each point, e.g. the result of
+        ``TrackConverter.extend``. The keys default to the indices of the
+        points in the batch.
+        """
+        if keys is None:
+            keys = range(len(easting))
+        if not hasattr(zone_number, '__len__'):
+            zone_number = [zone_number] * len(easting)
+        if zone_letter is None or isinstance(zone_letter, str):
+            zone_letter = [zone_letter] * len(easting)
+        if northern is not None and not hasattr(northern, '__len__'):
+            northern = [northern] * len(easting)
+
+        for i, key in enumerate(keys):
+            letter = zone_letter[i]
+            self.insert(key, easting[i], northing[i], int(zone_number[i]), None if letter is None else str(letter),
+                        None if northern is None else bool(northern[i]))
+
+    def remove(self, key):
+        """Removes a point, raises ``KeyError`` if the key is not in the index"""
+        point = self._points.pop(key)
+        cell = self._cell(*point)
+        bucket = self._cells[cell]
+        del bucket[key]
+        if not bucket:
+            del self._cells[cell]
+
+        zone_number = point[0]
+        self._zones[zone_number] -= 1
+        if not self._zones[zone_number]:
+            del self._zones[zone_number]
+
+    def query_radius(self, radius, easting, northing, zone_number, zone_letter=None, northern=None):
+        """Returns all points within ``radius`` metres of the query point
+
+        The query point is given like the result of ``from_latlon``, so
+        ``index.query_radius(radius, *from_latlon(lat, lon))`` works. The result
+        is a list of ``(key, distance)`` tuples, sorted by distance.
+        """
+        if radius > MAX_RADIUS:
+            raise ValueError('radius must not be larger than %d m' % MAX_RADIUS)
+        northern = _check_utm_args(easting, northing, zone_number, zone_letter, northern, strict=False)
+        y = northing if northern else northing - 10000000
+
+        return sorted(self._query(easting, y, zone_number, radius), key=lambda item: item[1])
+
+    def _query(self, x, y, zone_number, radius):
+        latitude, longitude = _inverse(x - 500000, y, lib=math)
+        zones = _search_zones(latitude, math.degrees(longitude) + zone_number_to_central_longitude(zone_number),
+                              radius)
+        for zone in zones & self._zones.keys():
+            if zone == zone_number:
+                zx, zy = x, y
+            else:
+                # Central meridians are 6 degrees apart
+                zx, zy = _forward(latitude, mod_angle(longitude + math.radians((zone_number - zone) * 6)),
+                                  lib=math)
+
+            min_cx, min_cy = int((zx - radius) // self.cell_size), int((zy - radius) // self.cell_size)
+            max_cx, max_cy = int((zx + radius) // self.cell_size), int((zy + radius) // self.cell_size)
+
+            if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > len(self._cells):
+                buckets = [bucket for (z, cx, cy), bucket in self._cells.items()
+                           if z == zone and min_cx <= cx <= max_cx and min_cy <= cy <= max_cy]
+            else:
+                buckets = [self._cells[cell]
+                           for cell in ((zone, cx, cy)
+                                        for cx in range(min_cx, max_cx + 1)
+                                        for cy in range(min_cy, max_cy + 1))
+                           if cell in self._cells]
+
+            for bucket in buckets:
+                for key, (_, px, py) in bucket.items():
+                    distance = math.hypot(px - zx, py - zy)
+                    if distance <= radius:
+                        yield key, distance
+
+    def nearest(self, k, easting, northing, zone_number, zone_letter=None, northern=None):
+        """Returns the ``k`` points nearest to the query point
+
+        The result is a list of ``(key, distance)`` tuples, sorted by
+        distance. Only points within ``MAX_RADIUS`` metres are considered.
+        """
+        northern = _check_utm_args(easting, northing, zone_number, zone_letter, northern, strict=False)
+        y = northing if northern else northing - 10000000
+
+        k = min(k, len(self))
+        radius = self.cell_size
+        while True:
+            radius = min(radius, MAX_RADIUS)
+            found = list(self._query(easting, y, zone_number, radius))
+            if len(found) >= k or radius == MAX_RADIUS:
+                break
+            radius *= 2
+
+        found.sort(key=lambda item: item[1])
+        return found[:k]
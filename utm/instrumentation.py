@@ -0,0 +1,161 @@
+"""Opt-in instrumentation of the conversion functions
+
+Instrumentation is disabled by default. While it is disabled the conversion
+functions only check the ``active`` flag of this module and do not time or
+count anything.
+
+Statistics are collected per function (``to_latlon``, ``from_latlon``, ...)
+and per backend:
+
+* ``scalar``: called with plain numbers
+* ``numpy``: called with NumPy arrays
+* ``parallel``: batches converted by worker processes
+"""
+import math
+import threading
+import time
+
+from utm.error import OutOfRangeError
+
+__all__ = ['enable_instrumentation', 'disable_instrumentation', 'get_stats', 'reset_stats',
+           'add_hook', 'remove_hook']
+
+active = False
+
+_enabled = False
+_hooks = []
+_stats = {}
+_lock = threading.Lock()
+
+
+def _update_active():
+    global active
+    active = _enabled or bool(_hooks)
+
+
+def enable_instrumentation():
+    """Starts collecting statistics, see ``get_stats()``"""
+    global _enabled
+    _enabled = True
+    _update_active()
+
+
+def disable_instrumentation():
+    """Stops collecting statistics, collected statistics are kept"""
+    global _enabled
+    _enabled = False
+    _update_active()
+
+
+def reset_stats():
+    with _lock:
+        _stats.clear()
+
+
+def add_hook(callback):
+    """Registers a callback that is called after every conversion
+
+    The callback receives the function name, the backend name, the number of
+    points, the elapsed time in seconds and the raised exception (or None)
+    as keyword arguments ``function``, ``backend``, ``points``, ``seconds``
+    and ``error``. Registering a hook does not require statistics to be
+    enabled.
+    """
+    _hooks.append(callback)
+    _update_active()
+
+
+def remove_hook(callback):
+    _hooks.remove(callback)
+    _update_active()
+
+
+def _bucket(value):
+    """Returns the smallest power of two that is greater or equal to value"""
+    return 1 << (math.ceil(value) - 1).bit_length() if value > 1 else 1
+
+
+def _new_entry():
+    return {
+        'calls': 0,
+        'points': 0,
+        'seconds': 0.0,
+        'out_of_range_errors': 0,
+        'other_errors': 0,
+        'time_histogram_us': {},
+        'batch_size_histogram': {},
+    }
+
+
+def record(function, backend, points, seconds, error=None):
+    """Records a single conversion call
+
+    This is used by the conversion functions and can also be called by code
+    that converts batches by other means (e.g. in worker processes).
+    """
+    if _enabled:
+        with _lock:
+            entry = _stats.setdefault(function, {}).get(backend)
+            if entry is None:
+                entry = _stats[function][backend] = _new_entry()
+
+            entry['calls'] += 1
+            entry['points'] += points
+            entry['seconds'] += seconds
+            if isinstance(error, OutOfRangeError):
+                entry['out_of_range_errors'] += 1
+            elif error is not None:
+                entry['other_errors'] += 1
+
+            histogram = entry['time_histogram_us']
+            bucket = _bucket(seconds * 1e6)
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+
+            histogram = entry['batch_size_histogram']
+            bucket = _bucket(points)
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+
+    for hook in list(_hooks):
+        hook(function=function, backend=backend, points=points, seconds=seconds, error=error)
+
+
+def measure(function, func, values, *args):
+    """Calls ``func(*args)`` and records its duration
+
+    ``values`` is one of the input arguments and is used to determine the
+    backend and the batch size.
+    """
+    if getattr(values, 'ndim', 0):
+        backend, points = 'numpy', int(values.size)
+    else:
+        backend, points = 'scalar', 1
+
+    start = time.perf_counter()
+    try:
+        result = func(*args)
+    except Exception as error:
+        record(function, backend, points, time.perf_counter() - start, error)
+        raise
+    record(function, backend, points, time.perf_counter() - start)
+    return result
+
+
+def get_stats():
+    """Returns a snapshot of the collected statistics
+
+    The snapshot is a nested dictionary ``{function: {backend: entry}}``
+    where each entry contains the number of calls, the number of converted
+    points, the total time in seconds, the number of failed calls, and
+    histograms of the call duration (in microseconds) and of the batch size.
+    Histogram keys are the inclusive upper bound of each power-of-two bucket.
+    """
+    with _lock:
+        return {
+            function: {
+                backend: dict(entry,
+                              time_histogram_us=dict(entry['time_histogram_us']),
+                              batch_size_histogram=dict(entry['batch_size_histogram']))
+                for backend, entry in backends.items()
+            }
+            for function, backends in _stats.items()
+        }
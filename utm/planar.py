@@ -0,0 +1,220 @@
+"""Planar distances and bounding boxes in UTM space
+
+All functions in this module work on NumPy arrays, so NumPy is required.
+Points are first brought into one common zone (see ``project()`` and
+``to_common_zone()``), after which distances are plain euclidean distances
+in metres on the UTM grid. The common zone must be close to all points, see
+``MAX_LONGITUDE_OFFSET``.
+"""
+import numpy as np
+
+from utm.bulk import latlon_to_zone_numbers
+from utm.conversion import (_forward, _inverse, from_latlon, mod_angle, check_valid_zone_number,
+                            zone_number_to_central_longitude)
+from utm.error import OutOfRangeError
+
+__all__ = ['project', 'to_common_zone', 'distances', 'pairwise_distances', 'nearest', 'bounding_box',
+           'in_box']
+
+# Upper bound for the number of elements of temporary distance matrices
+CHUNK_SIZE = 1 << 20
+
+# Largest distance in degrees of longitude between a point and the central
+# meridian of the common zone, which covers the neighbouring zones. Up to
+# here the projection is accurate to about 0.2 m, 17 degrees away the error
+# already is about 17 m.
+MAX_LONGITUDE_OFFSET = 9
+
+
+def _median_zone(zone_number):
+    """Returns the median zone of a point set, also for sets around 180 deg"""
+    first = int(zone_number.flat[0])
+    offsets = np.sort(((zone_number - first + 30) % 60 - 30).ravel())
+    return (first - 1 + int(offsets[(len(offsets) - 1) // 2])) % 60 + 1
+
+
+def _check_offset(longitude_offset, zone_number):
+    """Checks the longitude offsets (in degrees) from the central meridian of a zone"""
+    if np.any(np.abs(longitude_offset) > MAX_LONGITUDE_OFFSET):
+        raise OutOfRangeError('points too far from zone %d (must be within %d deg of its central meridian)'
+                              % (zone_number, MAX_LONGITUDE_OFFSET))
+
+
+def project(latitude, longitude, zone_number=None, northern=None):
+    """Converts a point set into one common UTM zone
+
+    Unlike ``from_latlon``, points on both sides of the equator are allowed.
+    They are all projected into the same hemisphere, so points on the other
+    side have northings below 0 m or above 10,000,000 m. Points more than
+    ``MAX_LONGITUDE_OFFSET`` degrees from the central meridian of the common
+    zone raise ``OutOfRangeError``.
+
+        Parameters
+        ----------
+        latitude: NumPy array
+            Latitudes of the points
+
+        longitude: NumPy array
+            Longitudes of the points
+
+        zone_number: int
+            Common zone number. Default is the median zone of the points
+
+        northern: bool
+            Common hemisphere. Default is the hemisphere of the first point
+
+        Returns
+        -------
+        easting: NumPy array
+
+        northing: NumPy array
+
+        zone_number: int
+
+        northern: bool
+    """
+    latitude = np.asarray(latitude, dtype=float)
+    longitude = np.asarray(longitude, dtype=float)
+    if zone_number is None:
+        zone_number = _median_zone(latlon_to_zone_numbers(latitude, longitude))
+    if northern is None:
+        northern = bool(latitude.flat[0] >= 0)
+    check_valid_zone_number(zone_number)
+    _check_offset((longitude - zone_number_to_central_longitude(zone_number) + 180) % 360 - 180, zone_number)
+
+    easting, northing, zone_number, _ = from_latlon(latitude, longitude, zone_number,
+                                                    force_northern=northern)
+    return easting, northing, zone_number, northern
+
+
+def to_common_zone(easting, northing, zone_number, northern, target_zone_number=None, target_northern=None):
+    """Moves UTM points from different zones into one common zone
+
+    Points more than ``MAX_LONGITUDE_OFFSET`` degrees from the central
+    meridian of the common zone raise ``OutOfRangeError``.
+
+        Parameters
+        ----------
+        easting: NumPy array
+            Eastings of the points
+
+        northing: NumPy array
+            Northings of the points
+
+        zone_number: int or NumPy array
+            Zone number of all points, or of each point
+
+        northern: bool or NumPy array
+            Hemisphere of all points, or of each point
+
+        target_zone_number: int
+            Common zone number. Default is the median zone of the points
+
+        target_northern: bool
+            Common hemisphere. Default is the hemisphere of the first point
+
+        Returns
+        -------
+        easting: NumPy array
+
+        northing: NumPy array
+
+        zone_number: int
+
+        northern: bool
+    """
+    easting = np.asarray(easting, dtype=float)
+    northing = np.asarray(northing, dtype=float)
+    zone_number = np.broadcast_to(zone_number, easting.shape)
+    northern = np.broadcast_to(northern, easting.shape)
+
+    if target_zone_number is None:
+        target_zone_number = _median_zone(zone_number)
+    if target_northern is None:
+        target_northern = bool(northern.flat[0])
+    check_valid_zone_number(target_zone_number)
+
+    # Work with northern hemisphere northings, which are continuous across
+    # the equator
+    northing = np.where(northern, northing, northing - 10000000)
+    result_easting = easting.copy()
+
+    for zone in np.unique(zone_number):
+        zone = int(zone)
+        if zone == target_zone_number:
+            continue
+        check_valid_zone_number(zone)
+        mask = zone_number == zone
+        latitude, longitude = _inverse(easting[mask] - 500000, northing[mask])
+        # Central meridians are 6 degrees apart
+        longitude = mod_angle(longitude + np.radians((zone - target_zone_number) * 6))
+        _check_offset(np.degrees(longitude), target_zone_number)
+        result_easting[mask], northing[mask] = _forward(latitude, longitude)
+
+    if not target_northern:
+        northing += 10000000
+
+    return result_easting, northing, target_zone_number, target_northern
+
+
+def distances(easting, northing, other_easting, other_northing):
+    """Returns the element-wise distances between two point sets in metres"""
+    return np.hypot(np.subtract(other_easting, easting), np.subtract(other_northing, northing))
+
+
+def pairwise_distances(easting, northing, other_easting=None, other_northing=None):
+    """Returns the matrix of distances between all pairs of points
+
+    If no second point set is given, the distances between all points of the
+    first set are returned.
+    """
+    easting = np.ravel(easting)
+    northing = np.ravel(northing)
+    if other_easting is None:
+        other_easting, other_northing = easting, northing
+    else:
+        other_easting = np.ravel(other_easting)
+        other_northing = np.ravel(other_northing)
+
+    return np.hypot(easting[:, np.newaxis] - other_easting, northing[:, np.newaxis] - other_northing)
+
+
+def nearest(easting, northing, query_easting, query_northing):
+    """Finds the nearest point for each query point
+
+    Returns the index into ``easting``/``northing`` of the nearest point and
+    the distance to it, for every query point. The queries are processed in
+    chunks so the temporary distance matrices stay small.
+    """
+    easting = np.ravel(easting)
+    northing = np.ravel(northing)
+    query_easting = np.ravel(query_easting)
+    query_northing = np.ravel(query_northing)
+    if len(easting) == 0:
+        raise ValueError('cannot find the nearest point in an empty point set')
+
+    index = np.empty(len(query_easting), dtype=np.intp)
+    distance = np.empty(len(query_easting))
+
+    step = max(1, CHUNK_SIZE // len(easting))
+    for start in range(0, len(query_easting), step):
+        end = start + step
+        matrix = pairwise_distances(query_easting[start:end], query_northing[start:end], easting, northing)
+        index[start:end] = np.argmin(matrix, axis=1)
+        distance[start:end] = matrix[np.arange(len(matrix)), index[start:end]]
+
+    return index, distance
+
+
+def bounding_box(easting, northing):
+    """Returns the bounding box ``(min_easting, min_northing, max_easting, max_northing)``"""
+    return np.min(easting), np.min(northing), np.max(easting), np.max(northing)
+
+
+def in_box(easting, northing, box):
+    """Tests which points are inside (or on the border of) a bounding box"""
+    min_easting, min_northing, max_easting, max_northing = box
+    easting = np.asarray(easting)
+    northing = np.asarray(northing)
+    return ((min_easting <= easting) & (easting <= max_easting) &
+            (min_northing <= northing) & (northing <= max_northing))
@@ -0,0 +1,118 @@
+"""Incremental conversion of GPS tracks"""
+import math
+
+from utm.conversion import (_forward, mod_angle, latlon_to_zone_number, latitude_to_zone_letter,
+                            zone_number_to_central_longitude, zone_longitudes, band_latitudes, use_numpy,
+                            mathlib, MISSING_ZONES)
+from utm.error import OutOfRangeError
+
+__all__ = ['TrackConverter']
+
+
+class TrackConverter(object):
+    """Converts a track of nearby points to UTM, one point at a time
+
+    The converter keeps the current zone and its central meridian, and only
+    looks up the zone again when a point leaves the current zone/band cell.
+    Unlike ``from_latlon`` with NumPy arrays, every point gets its own zone,
+    so tracks crossing zone boundaries are converted correctly.
+
+    With ``hysteresis`` (in degrees of longitude) a track stays in its
+    current zone until it is more than ``hysteresis`` degrees beyond the
+    zone boundary, which avoids flip-flopping between two zones when a track
+    runs along a boundary.
+    """
+
+    def __init__(self, hysteresis=0):
+        if hysteresis < 0:
+            raise ValueError('hysteresis must not be negative')
+        self.hysteresis = hysteresis
+        self.reset()
+
+    def reset(self):
+        """Forgets the current zone, e.g. before converting a new track"""
+        self.zone_number = None
+        self.zone_letter = None
+        self._northern = None
+        self._central_lon_rad = None
+        # Empty cell, so the first point always looks up its zone
+        self._south = self._north = self._west = self._east = 0
+
+    def _in_zone(self, longitude, zone_letter):
+        if (zone_letter, self.zone_number) in MISSING_ZONES:
+            return False
+        west, east = zone_longitudes(self.zone_number, zone_letter)
+        west -= self.hysteresis
+        east += self.hysteresis
+        return any(west <= lon < east for lon in (longitude, longitude - 360, longitude + 360))
+
+    def _update(self, latitude, longitude):
+        if not -80 <= latitude <= 84:
+            raise OutOfRangeError('latitude out of range (must be between 80 deg S and 84 deg N)')
+        if not -180 <= longitude <= 180:
+            raise OutOfRangeError('longitude out of range (must be between 180 deg W and 180 deg E)')
+
+        # The zone ranges differ between bands, so keep the current zone only
+        # if the point is close to its range in the band of the point
+        zone_letter = latitude_to_zone_letter(latitude)
+        if self.zone_number is None or not self.hysteresis or not self._in_zone(longitude, zone_letter):
+            zone_number = latlon_to_zone_number(latitude, longitude)
+            if zone_number != self.zone_number:
+                self.zone_number = zone_number
+                self._central_lon_rad = math.radians(zone_number_to_central_longitude(zone_number))
+
+        self.zone_letter = zone_letter
+        self._northern = self.zone_letter >= 'N'
+
+        self._south, self._north = band_latitudes(self.zone_letter)
+        self._west, self._east = zone_longitudes(self.zone_number, self.zone_letter)
+        self._west -= self.hysteresis
+        self._east += self.hysteresis
+
+    def _zone(self, latitude, longitude):
+        if not (self._south <= latitude < self._north and self._west <= longitude < self._east):
+            self._update(latitude, longitude)
+        return self.zone_number, self.zone_letter
+
+    def append(self, latitude, longitude):
+        """Converts the next point of the track
+
+        Returns ``(easting, northing, zone_number, zone_letter)`` like
+        ``from_latlon``.
+        """
+        zone_number, zone_letter = self._zone(latitude, longitude)
+
+        easting, northing = _forward(math.radians(latitude),
+                                     mod_angle(math.radians(longitude) - self._central_lon_rad),
+                                     lib=math)
+        if not self._northern:
+            northing += 10000000
+
+        return easting, northing, zone_number, zone_letter
+
+    def extend(self, latitudes, longitudes):
+        """Converts the next points of the track
+
+        Returns the eastings, northings, zone numbers and zone letters of the
+        points. With NumPy installed these are NumPy arrays and all points are
+        projected in one vectorized call, otherwise they are lists.
+        """
+        if not use_numpy:
+            results = [self.append(lat, lon) for lat, lon in zip(latitudes, longitudes)]
+            return tuple(list(values) for values in zip(*results)) if results else ([], [], [], [])
+
+        latitudes = mathlib.asarray(latitudes, dtype=float)
+        longitudes = mathlib.asarray(longitudes, dtype=float)
+        if latitudes.shape != longitudes.shape or latitudes.ndim != 1:
+            raise ValueError('latitudes and longitudes must be one-dimensional arrays of the same length')
+
+        zones = [self._zone(lat, lon) for lat, lon in zip(latitudes.tolist(), longitudes.tolist())]
+        zone_numbers = mathlib.array([zone[0] for zone in zones], dtype=int)
+        zone_letters = mathlib.array([zone[1] for zone in zones], dtype='U1')
+
+        central_lon_rad = mathlib.radians((zone_numbers - 1) * 6 - 180 + 3)
+        easting, northing = _forward(mathlib.radians(latitudes),
+                                     mod_angle(mathlib.radians(longitudes) - central_lon_rad))
+        northing[zone_letters < 'N'] += 10000000
+
+        return easting, northing, zone_numbers, zone_letters